@@ -43,7 +43,7 @@ def example_1_simple_overhanging_beam():
     
     # Plot results
     fig, axes = beam.plot_complete_analysis(figsize=(15, 10))
-    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/example_1_results.png', dpi=300, bbox_inches='tight')
+    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/example_1_results.png', dpi=150, bbox_inches='tight')
     plt.show()
     
     return beam
@@ -88,7 +88,7 @@ def example_2_beam_with_varying_loads():
     
     # Plot results
     fig, axes = beam.plot_complete_analysis(figsize=(15, 10))
-    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/example_2_results.png', dpi=300, bbox_inches='tight')
+    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/example_2_results.png', dpi=150, bbox_inches='tight')
     plt.show()
     
     return beam
@@ -139,7 +139,7 @@ def example_3_complex_loading():
     
     # Plot results
     fig, axes = beam.plot_complete_analysis(figsize=(15, 10))
-    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/example_3_results.png', dpi=300, bbox_inches='tight')
+    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/example_3_results.png', dpi=150, bbox_inches='tight')
     plt.show()
     
     return beam
@@ -159,7 +159,7 @@ def compare_beams(beams, titles):
         
         # Plot shear force
         sf_ax.plot(beam.x_coords, beam.shear_force, 'b-', linewidth=2)
-        sf_ax.fill_between(beam.x_coords, 0, beam.shear_force, alpha=0.3, color='blue')
+        sf_ax.fill_between(beam.x_coords, 0, beam.shear_force, alpha=0.3, color='blue', rasterized=True)
         sf_ax.axhline(y=0, color='black', linestyle='-', linewidth=1)
         sf_ax.grid(True, alpha=0.3)
         sf_ax.set_title(f'{title}\nShear Force', fontsize=10, fontweight='bold')
@@ -167,7 +167,7 @@ def compare_beams(beams, titles):
         
         # Plot bending moment
         bm_ax.plot(beam.x_coords, beam.bending_moment, 'r-', linewidth=2)
-        bm_ax.fill_between(beam.x_coords, 0, beam.bending_moment, alpha=0.3, color='red')
+        bm_ax.fill_between(beam.x_coords, 0, beam.bending_moment, alpha=0.3, color='red', rasterized=True)
         bm_ax.axhline(y=0, color='black', linestyle='-', linewidth=1)
         bm_ax.grid(True, alpha=0.3)
         bm_ax.set_title('Bending Moment', fontsize=10, fontweight='bold')
@@ -175,7 +175,7 @@ def compare_beams(beams, titles):
         bm_ax.set_ylabel('B.M. (kN⋅m)', fontsize=9)
     
     plt.tight_layout()
-    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/beam_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig('c:/Users/Aditya/OneDrive/Desktop/project/beam_comparison.png', dpi=150, bbox_inches='tight')
     plt.show()
 
 def main():
@@ -7,14 +7,117 @@ A comprehensive structural analysis tool for beam design and visualization
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import matplotlib.patches as patches
+from matplotlib.collections import LineCollection
 from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-import json
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Line3DCollection
+import orjson
 import os
+import functools
+
+# Integer codes for the structure-of-arrays load storage
+LOAD_TYPE_CODES = {'concentrated': 0, 'distributed': 1, 'varying': 2}
+
+# Unit beam box (x in [0, 1], y and z in [-1, 1]) and its faces as vertex indices
+BEAM_TEMPLATE = np.array([
+    [0, -1, -1], [0, 1, -1], [0, 1, 1], [0, -1, 1],
+    [1, -1, -1], [1, 1, -1], [1, 1, 1], [1, -1, 1]
+], dtype=float)
+BEAM_FACES = np.array([
+    [0, 1, 2, 3],  # Left face
+    [4, 5, 6, 7],  # Right face
+    [0, 1, 5, 4],  # Bottom face
+    [2, 3, 7, 6],  # Top face
+    [1, 2, 6, 5],  # Front face
+    [4, 7, 3, 0]   # Back face
+])
+
+# (label, load dict key) pairs for the load input panels
+LOAD_INPUT_FIELDS = {
+    'concentrated': [("Position (m):", 'position'), ("Magnitude (kN):", 'magnitude')],
+    'distributed': [("Start Position (m):", 'start_pos'), ("End Position (m):", 'end_pos'),
+                    ("Intensity (kN/m):", 'intensity')],
+    'varying': [("Start Position (m):", 'start_pos'), ("End Position (m):", 'end_pos'),
+                ("Start Intensity (kN/m):", 'start_intensity'), ("End Intensity (kN/m):", 'end_intensity')]
+}
+
+
+def polyline_segments(points):
+    """Return the consecutive line segments of a polyline as an (n-1, 2, 3) array"""
+    points = np.asarray(points, dtype=float)
+    return np.stack([points[:-1], points[1:]], axis=1)
+
+
+# Support outline segments relative to the support position, with colour and line width
+SUPPORT_TRIANGLE = polyline_segments([[-0.3, 0, -1], [0.3, 0, -1], [0, 0, -1.5], [-0.3, 0, -1]])
+SUPPORT_OUTLINES = {
+    'pin': (SUPPORT_TRIANGLE, 'green', 3),
+    'roller': (SUPPORT_TRIANGLE, 'blue', 3),
+    'fixed': (polyline_segments([[-0.2, 0, -0.5], [0.2, 0, -0.5], [0.2, 0, -1.5],
+                                 [-0.2, 0, -1.5], [-0.2, 0, -0.5]]), 'red', 4)
+}
+
+# Filled top face of a fixed support relative to its position
+FIXED_FILL = np.array([[-0.2, -0.1, -0.5], [0.2, -0.1, -0.5], [0.2, 0.1, -0.5], [-0.2, 0.1, -0.5]])
+
+
+def arrow_points(start_pos, end_pos, start_intensity, end_intensity):
+    """Return arrow positions and intensities along a batch of distributed loads"""
+    num_arrows = np.maximum(5, ((end_pos - start_pos) * 2).astype(int))
+    counts = num_arrows + 1
+    
+    # Arrow index within its own load, divided by that load's arrow count
+    first = np.cumsum(counts) - counts
+    ratio = (np.arange(counts.sum()) - np.repeat(first, counts)) / np.repeat(num_arrows, counts)
+    x = np.repeat(start_pos, counts) + ratio * np.repeat(end_pos - start_pos, counts)
+    intensity = np.repeat(start_intensity, counts) + ratio * np.repeat(end_intensity - start_intensity, counts)
+    return x, intensity
+
+
+def arrow_segments(x, z_tail, dz, head_ratio):
+    """Return shaft and arrowhead segments for vertical arrows in the y=0 plane"""
+    n = len(x)
+    z_tip = z_tail + dz
+    shafts = np.zeros((n, 2, 3))
+    shafts[:, :, 0] = x[:, None]
+    shafts[:, 0, 2] = z_tail
+    shafts[:, 1, 2] = z_tip
+    
+    # Two barbs per arrow, swept back from the tip at 15 degrees
+    head_length = head_ratio * dz
+    half_width = np.abs(head_length) * np.tan(np.radians(15))
+    heads = np.zeros((n, 2, 2, 3))
+    heads[:, :, 0, 0] = x[:, None]
+    heads[:, :, 0, 2] = z_tip[:, None]
+    heads[:, 0, 1, 0] = x - half_width
+    heads[:, 1, 1, 0] = x + half_width
+    heads[:, :, 1, 2] = (z_tip - head_length)[:, None]
+    return shafts, heads.reshape(2 * n, 2, 3)
+
+
+@functools.lru_cache(maxsize=8)
+def x_grid(length, npoints):
+    """Return a shared, read-only grid of sample positions along the beam"""
+    x = np.linspace(0, length, npoints)
+    x.flags.writeable = False
+    return x
+
+
+def area_vertices(x, y):
+    """Return the closed polygon between a curve and the x axis"""
+    return np.column_stack([np.concatenate([x, x[::-1]]), np.concatenate([y, np.zeros_like(y)])])
+
+
+def invalid_loads(load_arr, beam_length):
+    """Return a boolean mask of loads that do not lie on the beam"""
+    concentrated = load_arr['type'] == LOAD_TYPE_CODES['concentrated']
+    pos, start, end = load_arr['pos'], load_arr['start'], load_arr['end']
+    bad_point = (pos < 0) | (pos > beam_length)
+    bad_span = (start >= end) | (start < 0) | (end > beam_length)
+    return np.where(concentrated, bad_point, bad_span)
+
 
 class BeamDesigner:
     def __init__(self, root):
@@ -25,10 +128,42 @@ class BeamDesigner:
         
         # Beam properties
         self.beam_length = 10.0
-        self.supports = []
         self.loads = []
         self.analysis_results = None
         self.is_analyzing = False
+        self.chart_points = 100  # Samples along the beam in the 2D charts
+        
+        # Supports, with their positions kept sorted for the chart diagrams
+        self.set_supports([])
+        
+        # Parallel NumPy arrays mirroring self.loads for vectorized analysis
+        self._load_arr = self.build_load_arrays([])
+        
+        # Persistent plot artists reused across redraws
+        self._beam_poly = None
+        self._fixed_poly = None  # Filled rectangles of all fixed supports, drawn with the dynamic artists
+        self._drawn_length = None
+        self._dyn_artists = []  # Support and load artists, replaced on every update
+        self._segment_batches = []  # (segments, colors, linewidths) queued for the shared line collection
+        self._background = None
+        self._update_pending = False
+        
+        # Last valid float of each numeric input, refreshed by Tk variable traces
+        self._cached = {}
+        
+        # Inputs and results of the last analysis, reused while the design is unchanged
+        self._analysis_key = None
+        self._diagram_cache = None  # (key, diagram arrays) of the last charts window
+        
+        # Persistent charts figure, its diagram curves, fills and support markers, and the per-design artists on it
+        self._chart_fig = None
+        self._chart_lines = {}
+        self._chart_fills = {}
+        self._chart_markers = []
+        self._chart_artists = []
+        self._chart_window = None  # The open charts window, if any
+        self._chart_canvas = None  # Canvas of the open charts window, if any
+        self._chart_backgrounds = None
         
         # Colors
         self.colors = {
@@ -98,7 +233,7 @@ class BeamDesigner:
         tk.Label(frame, text="Length (m):", fg=self.colors['secondary'], 
                 bg=self.colors['sidebar']).pack(anchor=tk.W, padx=5)
         
-        self.length_var = tk.DoubleVar(value=10.0)
+        self.length_var = self.watch_float(tk.DoubleVar(value=10.0), 'length')
         length_entry = tk.Entry(frame, textvariable=self.length_var, width=15)
         length_entry.pack(padx=5, pady=2)
         
@@ -114,7 +249,7 @@ class BeamDesigner:
         tk.Label(frame, text="Position (m):", fg=self.colors['secondary'], 
                 bg=self.colors['sidebar']).pack(anchor=tk.W, padx=5)
         
-        self.support_pos_var = tk.DoubleVar()
+        self.support_pos_var = self.watch_float(tk.DoubleVar(), 'support_pos')
         pos_entry = tk.Entry(frame, textvariable=self.support_pos_var, width=15)
         pos_entry.pack(padx=5, pady=2)
         
@@ -144,10 +279,23 @@ class BeamDesigner:
         load_combo.pack(padx=5, pady=2)
         load_combo.bind('<<ComboboxSelected>>', self.update_load_inputs)
         
-        # Load input frame
+        # Load input frame with one prebuilt panel per load type
         self.load_input_frame = tk.Frame(frame, bg=self.colors['sidebar'])
         self.load_input_frame.pack(fill=tk.X, padx=5, pady=5)
         
+        self._load_panels = {}
+        self.load_vars = {}
+        for load_type, fields in LOAD_INPUT_FIELDS.items():
+            panel = tk.Frame(self.load_input_frame, bg=self.colors['sidebar'])
+            self.load_vars[load_type] = {}
+            for label, name in fields:
+                tk.Label(panel, text=label, 
+                        fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
+                var = self.watch_float(tk.DoubleVar(), (load_type, name))
+                tk.Entry(panel, textvariable=var, width=15).pack(pady=2)
+                self.load_vars[load_type][name] = var
+            self._load_panels[load_type] = panel
+        
         self.update_load_inputs()
         
         add_load_btn = tk.Button(frame, text="Add Load", bg=self.colors['button'],
@@ -155,61 +303,33 @@ class BeamDesigner:
                                 command=self.add_load)
         add_load_btn.pack(pady=5)
         
-    def update_load_inputs(self, event=None):
-        """Update load input fields based on load type"""
-        # Clear existing inputs
-        for widget in self.load_input_frame.winfo_children():
-            widget.destroy()
-            
-        load_type = self.load_type_var.get()
+    def watch_float(self, var, key):
+        """Cache the value of a numeric Tk variable whenever it is written"""
+        def cache(*args):
+            try:
+                self._cached[key] = float(var.get())
+            except tk.TclError:
+                self._cached[key] = None
+                
+        var.trace_add('write', cache)
+        cache()
+        return var
         
-        if load_type == "concentrated":
-            tk.Label(self.load_input_frame, text="Position (m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_pos_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_pos_var, width=15).pack(pady=2)
-            
-            tk.Label(self.load_input_frame, text="Magnitude (kN):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_mag_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_mag_var, width=15).pack(pady=2)
-            
-        elif load_type == "distributed":
-            tk.Label(self.load_input_frame, text="Start Position (m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_start_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_start_var, width=15).pack(pady=2)
-            
-            tk.Label(self.load_input_frame, text="End Position (m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_end_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_end_var, width=15).pack(pady=2)
-            
-            tk.Label(self.load_input_frame, text="Intensity (kN/m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_intensity_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_intensity_var, width=15).pack(pady=2)
-            
-        elif load_type == "varying":
-            tk.Label(self.load_input_frame, text="Start Position (m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_start_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_start_var, width=15).pack(pady=2)
-            
-            tk.Label(self.load_input_frame, text="End Position (m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_end_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_end_var, width=15).pack(pady=2)
-            
-            tk.Label(self.load_input_frame, text="Start Intensity (kN/m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_start_intensity_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_start_intensity_var, width=15).pack(pady=2)
+    def cached_float(self, key):
+        """Return the cached value of a numeric input, raising TclError if it is not a number"""
+        value = self._cached[key]
+        if value is None:
+            raise tk.TclError(f"expected floating-point number for {key}")
+        return value
+        
+    def update_load_inputs(self, event=None):
+        """Show the input panel for the selected load type"""
+        for panel in self._load_panels.values():
+            panel.pack_forget()
             
-            tk.Label(self.load_input_frame, text="End Intensity (kN/m):", 
-                    fg=self.colors['secondary'], bg=self.colors['sidebar']).pack(anchor=tk.W)
-            self.load_end_intensity_var = tk.DoubleVar()
-            tk.Entry(self.load_input_frame, textvariable=self.load_end_intensity_var, width=15).pack(pady=2)
+        panel = self._load_panels.get(self.load_type_var.get())
+        if panel is not None:
+            panel.pack(fill=tk.X)
     
     def create_analysis_section(self, parent):
         """Create analysis controls"""
@@ -225,18 +345,26 @@ class BeamDesigner:
                              command=self.clear_all)
         clear_btn.pack(pady=2)
         
-        # Results display
-        self.results_text = tk.Text(frame, height=8, width=35, bg='#001122', 
-                                   fg=self.colors['accent'], font=("Courier", 9))
+        # Results display (read-only)
+        self.results_text = tk.Text(frame, height=8, width=35, bg='#001122',
+                                   fg=self.colors['accent'], font=("Courier", 9),
+                                   state="disabled")
         self.results_text.pack(padx=5, pady=5)
         
     def create_configuration_section(self, parent):
         """Create configuration display"""
         frame = self.create_section_frame(parent, "📋 Current Configuration")
         
-        self.config_text = tk.Text(frame, height=6, width=35, bg='#001122', 
-                                  fg=self.colors['secondary'], font=("Courier", 9))
+        self.config_text = tk.Text(frame, height=6, width=35, bg='#001122',
+                                  fg=self.colors['secondary'], font=("Courier", 9),
+                                  state="disabled")
         self.config_text.pack(padx=5, pady=5)
+    
+    def set_readonly_text(self, widget, text):
+        """Replace the contents of a read-only Text widget"""
+        widget.config(state="normal")
+        widget.replace(1.0, tk.END, text)
+        widget.config(state="disabled")
         
     def create_main_content(self, parent):
         """Create the main visualization area"""
@@ -266,6 +394,7 @@ class BeamDesigner:
         
         self.canvas = FigureCanvasTkAgg(self.fig, main_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
         
         self.setup_3d_plot()
         
@@ -281,39 +410,56 @@ class BeamDesigner:
         
     def create_beam(self):
         """Create or update the beam visualization"""
-        self.beam_length = self.length_var.get()
+        try:
+            self.beam_length = self.cached_float('length')
+        except tk.TclError:
+            messagebox.showerror("Error", "Please enter valid numerical values!")
+            return
         self.update_visualization()
         self.update_config_display()
         
     def add_support(self):
         """Add a support to the beam"""
-        position = self.support_pos_var.get()
+        try:
+            position = self.cached_float('support_pos')
+        except tk.TclError:
+            messagebox.showerror("Error", "Please enter valid numerical values!")
+            return
         support_type = self.support_type_var.get()
         
         if position < 0 or position > self.beam_length:
             messagebox.showerror("Error", "Invalid support position!")
             return
             
-        # Remove existing support at this position
-        self.supports = [s for s in self.supports if abs(s['position'] - position) > 0.1]
-        
-        # Add new support
-        self.supports.append({
+        # Replace any existing support at this position with the new one
+        supports = [s for s in self.supports if abs(s['position'] - position) > 0.1]
+        supports.append({
             'position': position,
             'type': support_type
         })
+        self.set_supports(supports)
         
         self.update_visualization()
         self.update_config_display()
         
+    def set_supports(self, supports):
+        """Replace the supports and refresh their sorted positions"""
+        self.supports = supports
+        self._support_positions = np.sort(np.array([s['position'] for s in supports], dtype=float))
+        
     def add_load(self):
         """Add a load to the beam"""
         load_type = self.load_type_var.get()
+        if load_type not in self.load_vars:
+            messagebox.showerror("Error", "Unknown load type!")
+            return
+        def value(name):
+            return self.cached_float((load_type, name))
         
         try:
             if load_type == "concentrated":
-                position = self.load_pos_var.get()
-                magnitude = self.load_mag_var.get()
+                position = value('position')
+                magnitude = value('magnitude')
                 
                 if position < 0 or position > self.beam_length:
                     raise ValueError("Invalid load position!")
@@ -325,9 +471,9 @@ class BeamDesigner:
                 })
                 
             elif load_type == "distributed":
-                start_pos = self.load_start_var.get()
-                end_pos = self.load_end_var.get()
-                intensity = self.load_intensity_var.get()
+                start_pos = value('start_pos')
+                end_pos = value('end_pos')
+                intensity = value('intensity')
                 
                 if start_pos >= end_pos or start_pos < 0 or end_pos > self.beam_length:
                     raise ValueError("Invalid load parameters!")
@@ -340,10 +486,10 @@ class BeamDesigner:
                 })
                 
             elif load_type == "varying":
-                start_pos = self.load_start_var.get()
-                end_pos = self.load_end_var.get()
-                start_intensity = self.load_start_intensity_var.get()
-                end_intensity = self.load_end_intensity_var.get()
+                start_pos = value('start_pos')
+                end_pos = value('end_pos')
+                start_intensity = value('start_intensity')
+                end_intensity = value('end_intensity')
                 
                 if start_pos >= end_pos or start_pos < 0 or end_pos > self.beam_length:
                     raise ValueError("Invalid load parameters!")
@@ -363,9 +509,50 @@ class BeamDesigner:
             messagebox.showerror("Error", "Please enter valid numerical values!")
             return
             
+        self.append_load_array(self.loads[-1])
         self.update_visualization()
         self.update_config_display()
         
+    def build_load_arrays(self, loads):
+        """Build structure-of-arrays storage from a list of load dicts"""
+        n = len(loads)
+        arr = {
+            'type': np.empty(n, dtype=int),
+            'pos': np.zeros(n),
+            'mag': np.zeros(n),
+            'start': np.zeros(n),
+            'end': np.zeros(n),
+            'i0': np.zeros(n),
+            'i1': np.zeros(n)
+        }
+        
+        for k, load in enumerate(loads):
+            arr['type'][k] = LOAD_TYPE_CODES[load['type']]
+            if load['type'] == 'concentrated':
+                arr['pos'][k] = load['position']
+                arr['mag'][k] = load['magnitude']
+            else:
+                arr['start'][k] = load['start_pos']
+                arr['end'][k] = load['end_pos']
+                if load['type'] == 'distributed':
+                    arr['i0'][k] = arr['i1'][k] = load['intensity']
+                else:
+                    arr['i0'][k] = load['start_intensity']
+                    arr['i1'][k] = load['end_intensity']
+        
+        return arr
+        
+    def load_rows(self):
+        """Iterate over loads as (type code, position, magnitude, start, end, i0, i1) tuples"""
+        arr = self._load_arr
+        return zip(*(arr[key].tolist() for key in ('type', 'pos', 'mag', 'start', 'end', 'i0', 'i1')))
+        
+    def append_load_array(self, load):
+        """Append a single load dict to the structure-of-arrays storage"""
+        new = self.build_load_arrays([load])
+        for key, values in new.items():
+            self._load_arr[key] = np.concatenate((self._load_arr[key], values))
+        
     def analyze_beam(self):
         """Perform beam analysis"""
         if len(self.supports) < 2:
@@ -376,49 +563,51 @@ class BeamDesigner:
             messagebox.showerror("Error", "Please add at least one load!")
             return
             
-        self.analysis_results = self.perform_analysis()
+        key = self.analysis_key()
+        if key != self._analysis_key or self.analysis_results is None:
+            self.analysis_results = self.perform_analysis()
+            self._analysis_key = key
         self.display_results()
+        self.refresh_charts()
+        
+    def analysis_key(self):
+        """Return a snapshot of every input that perform_analysis depends on"""
+        supports = tuple((s['position'], s['type']) for s in self.supports)
+        loads = tuple(values.tobytes() for values in self._load_arr.values())
+        return self.beam_length, supports, loads
         
     def perform_analysis(self):
         """Simplified beam analysis"""
         # This is a simplified analysis - real structural analysis would be much more complex
-        total_load = 0
-        moment_sum = 0
-        
-        # Calculate total loads and moments
-        for load in self.loads:
-            if load['type'] == 'concentrated':
-                total_load += load['magnitude']
-                moment_sum += load['magnitude'] * load['position']
-            elif load['type'] == 'distributed':
-                length = load['end_pos'] - load['start_pos']
-                load_magnitude = load['intensity'] * length
-                total_load += load_magnitude
-                center = (load['start_pos'] + load['end_pos']) / 2
-                moment_sum += load_magnitude * center
-            elif load['type'] == 'varying':
-                length = load['end_pos'] - load['start_pos']
-                avg_intensity = (load['start_intensity'] + load['end_intensity']) / 2
-                load_magnitude = avg_intensity * length
-                total_load += load_magnitude
-                # For triangular/trapezoidal loads, centroid calculation is more complex
-                center = (load['start_pos'] + load['end_pos']) / 2
-                moment_sum += load_magnitude * center
-        
-        # Simple reaction calculation (assuming 2 supports for statically determinate beam)
-        if len(self.supports) == 2:
-            support_positions = [s['position'] for s in self.supports]
-            L = abs(support_positions[1] - support_positions[0])
-            
-            # Reaction at second support
-            R2 = moment_sum / L if L > 0 else 0
-            # Reaction at first support
-            R1 = total_load - R2
-            
-            reactions = [R1, R2]
-        else:
-            # For statically indeterminate beams, this is a simplified approach
-            reactions = [total_load / len(self.supports)] * len(self.supports)
+        arr = self._load_arr
+        
+        # Concentrated loads
+        mask_c = arr['type'] == LOAD_TYPE_CODES['concentrated']
+        mag_c = arr['mag'][mask_c]
+        total_load = mag_c.sum()
+        moment_sum = np.dot(mag_c, arr['pos'][mask_c])
+        
+        # Distributed and varying loads (a distributed load is a trapezoid with i0 == i1)
+        mask_v = ~mask_c
+        start, end = arr['start'][mask_v], arr['end'][mask_v]
+        i0, i1 = arr['i0'][mask_v], arr['i1'][mask_v]
+        mag_v = 0.5 * (i0 + i1) * (end - start)
+        total_load += mag_v.sum()
+        
+        # Exact first moment of each trapezoid about x = 0, computed directly so that a
+        # zero-resultant load (i0 == -i1) still contributes its couple
+        moment_sum += np.sum(mag_v * start + (end - start) ** 2 * (i0 + 2 * i1) / 6)
+        
+        total_load = float(total_load)
+        moment_sum = float(moment_sum)
+        
+        # Reactions from force and moment equilibrium about x = 0. Exact for two
+        # supports; for statically indeterminate beams this is the minimum-norm
+        # set of reactions that still satisfies equilibrium.
+        support_positions = np.array([s['position'] for s in self.supports], dtype=float)
+        A = np.vstack([np.ones_like(support_positions), support_positions])
+        b = np.array([total_load, moment_sum])
+        reactions = np.linalg.lstsq(A, b, rcond=None)[0].tolist()
         
         # Calculate maximum moment (simplified)
         max_moment = abs(total_load * self.beam_length / 8)  # Approximation for uniformly loaded beam
@@ -465,13 +654,24 @@ Max Deflection: {results['max_deflection']:.3f} mm
         for i, (reaction, position) in enumerate(zip(results['reactions'], results['support_positions'])):
             result_text += f"Support {i+1} ({position:.1f}m): {reaction:.2f} kN\n"
         
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(1.0, result_text)
+        self.set_readonly_text(self.results_text, result_text)
         
     def update_visualization(self):
-        """Update the 3D visualization"""
-        self.ax.clear()
-        self.setup_3d_plot()
+        """Schedule a 3D visualization update, coalescing rapid changes into one redraw"""
+        if self._update_pending:
+            return
+        self._update_pending = True
+        self.root.after(50, self.redraw_visualization)
+        
+    def redraw_visualization(self):
+        """Redraw the 3D visualization"""
+        self._update_pending = False
+        
+        # Remove stale support and load artists; axes setup and the beam are reused
+        for artist in self._dyn_artists:
+            artist.remove()
+        self._dyn_artists.clear()
+        self._segment_batches.clear()
         
         # Draw beam
         self.draw_beam()
@@ -482,137 +682,170 @@ Max Deflection: {results['max_deflection']:.3f} mm
         # Draw loads
         self.draw_loads()
         
-        # Update plot limits
-        margin = max(2, self.beam_length * 0.1)
-        self.ax.set_xlim(-margin, self.beam_length + margin)
-        self.ax.set_ylim(-2, 3)
-        self.ax.set_zlim(-2, 3)
-        
-        self.canvas.draw()
+        # Draw every queued support outline and load arrow as one collection
+        self.draw_segments()
+        
+        # Supports and loads are blitted over a cached background
+        for artist in self._dyn_artists:
+            artist.set_animated(True)
+        
+        # Update plot limits only when the beam length changes
+        if self.beam_length != self._drawn_length or self._background is None:
+            margin = max(2, self.beam_length * 0.1)
+            self.ax.set_xlim(-margin, self.beam_length + margin)
+            self.ax.set_ylim(-2, 3)
+            self.ax.set_zlim(-2, 3)
+            self._drawn_length = self.beam_length
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self.draw_dynamic_artists()
+            self.canvas.blit(self.fig.bbox)
+        
+    def on_draw(self, event):
+        """Cache the static background after a full redraw and overlay the dynamic artists"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_dynamic_artists()
+        
+    def draw_dynamic_artists(self):
+        """Draw the animated support and load artists onto the canvas"""
+        for artist in [self._fixed_poly, *self._dyn_artists]:
+            if artist is None:
+                continue
+            # Collections need their 3D projection refreshed outside a full draw
+            if hasattr(artist, 'do_3d_projection'):
+                artist.do_3d_projection()
+            self.ax.draw_artist(artist)
         
     def draw_beam(self):
         """Draw the main beam"""
+        if self._beam_poly is not None and self.beam_length == self._drawn_length:
+            return
+            
         # Beam dimensions
         width = 0.3
         height = 0.5
         
-        # Define beam vertices
-        vertices = [
-            [0, -width/2, -height/2], [0, width/2, -height/2],
-            [0, width/2, height/2], [0, -width/2, height/2],
-            [self.beam_length, -width/2, -height/2], [self.beam_length, width/2, -height/2],
-            [self.beam_length, width/2, height/2], [self.beam_length, -width/2, height/2]
-        ]
-        
-        # Define faces
-        faces = [
-            [vertices[0], vertices[1], vertices[2], vertices[3]],  # Left face
-            [vertices[4], vertices[5], vertices[6], vertices[7]],  # Right face
-            [vertices[0], vertices[1], vertices[5], vertices[4]],  # Bottom face
-            [vertices[2], vertices[3], vertices[7], vertices[6]],  # Top face
-            [vertices[1], vertices[2], vertices[6], vertices[5]],  # Front face
-            [vertices[4], vertices[7], vertices[3], vertices[0]]   # Back face
-        ]
-        
-        # Create 3D polygon collection
-        beam_collection = Poly3DCollection(faces, alpha=0.7, facecolor='lightgray', edgecolor='black')
-        self.ax.add_collection3d(beam_collection)
+        # Scale the unit box and gather the face vertices
+        vertices = BEAM_TEMPLATE * [self.beam_length, width/2, height/2]
+        faces = vertices[BEAM_FACES]
+        
+        # Create the 3D polygon collection once, then only update its vertices
+        if self._beam_poly is None:
+            self._beam_poly = Poly3DCollection(faces, alpha=0.7, facecolor='lightgray', edgecolor='black')
+            self.ax.add_collection3d(self._beam_poly)
+        else:
+            self._beam_poly.set_verts(faces)
+        
+    def queue_segments(self, segments, colors, linewidth):
+        """Queue line segments for the shared line collection built in draw_segments"""
+        n = len(segments)
+        self._segment_batches.append((segments, np.broadcast_to(colors, n), np.full(n, linewidth, dtype=float)))
+        
+    def draw_segments(self):
+        """Draw all queued line segments as a single Line3DCollection"""
+        if not self._segment_batches:
+            return
+            
+        segments, colors, linewidths = zip(*self._segment_batches)
+        collection = Line3DCollection(np.concatenate(segments), colors=np.concatenate(colors),
+                                      linewidths=np.concatenate(linewidths))
+        self.ax.add_collection3d(collection)
+        self._dyn_artists.append(collection)
         
     def draw_supports(self):
         """Draw support symbols"""
+        artists = self._dyn_artists
+        roller_xs = []
+        fixed_xs = []
         for support in self.supports:
             x = support['position']
             support_type = support['type']
             
+            # Pin and roller supports are triangles, fixed supports are rectangles
+            outline, color, linewidth = SUPPORT_OUTLINES[support_type]
+            self.queue_segments(outline + [x, 0, 0], color, linewidth)
+            
             if support_type == 'pin':
-                # Draw pin support as a triangle
-                triangle_x = [x-0.3, x+0.3, x, x-0.3]
-                triangle_y = [0, 0, 0, 0]
-                triangle_z = [-1, -1, -1.5, -1]
-                self.ax.plot(triangle_x, triangle_y, triangle_z, 'g-', linewidth=3)
-                self.ax.text(x, 0, -1.8, 'PIN', ha='center', color='green', fontweight='bold')
+                artists.append(self.ax.text(x, 0, -1.8, 'PIN', ha='center', color='green', fontweight='bold'))
                 
             elif support_type == 'roller':
-                # Draw roller support as a triangle with circles
-                triangle_x = [x-0.3, x+0.3, x, x-0.3]
-                triangle_y = [0, 0, 0, 0]
-                triangle_z = [-1, -1, -1.5, -1]
-                self.ax.plot(triangle_x, triangle_y, triangle_z, 'b-', linewidth=3)
-                
-                # Draw rollers as small circles
-                for i, roller_x in enumerate([x-0.2, x, x+0.2]):
-                    circle_x = [roller_x] * 10
-                    circle_y = np.linspace(-0.1, 0.1, 10)
-                    circle_z = [-1.7] * 10
-                    self.ax.plot(circle_x, circle_y, circle_z, 'ko', markersize=3)
+                # Rollers are drawn as small circles in a single scatter below
+                roller_xs.extend([x-0.2, x, x+0.2])
                 
-                self.ax.text(x, 0, -2, 'ROLLER', ha='center', color='blue', fontweight='bold')
+                artists.append(self.ax.text(x, 0, -2, 'ROLLER', ha='center', color='blue', fontweight='bold'))
                 
             elif support_type == 'fixed':
-                # Draw fixed support as a rectangle
-                rect_x = [x-0.2, x+0.2, x+0.2, x-0.2, x-0.2]
-                rect_y = [0, 0, 0, 0, 0]
-                rect_z = [-0.5, -0.5, -1.5, -1.5, -0.5]
-                self.ax.plot(rect_x, rect_y, rect_z, 'r-', linewidth=4)
-                
-                # Fill the rectangle
-                vertices = [[x-0.2, -0.1, -0.5], [x+0.2, -0.1, -0.5], 
-                           [x+0.2, 0.1, -0.5], [x-0.2, 0.1, -0.5]]
-                faces = [vertices]
-                fixed_collection = Poly3DCollection(faces, alpha=0.7, facecolor='red')
-                self.ax.add_collection3d(fixed_collection)
+                # Rectangles are filled in a single collection below
+                fixed_xs.append(x)
                 
-                self.ax.text(x, 0, -1.8, 'FIXED', ha='center', color='red', fontweight='bold')
+                artists.append(self.ax.text(x, 0, -1.8, 'FIXED', ha='center', color='red', fontweight='bold'))
+        
+        if roller_xs:
+            n = len(roller_xs)
+            artists.append(self.ax.scatter(roller_xs, np.zeros(n), np.full(n, -1.7),
+                                           c='k', s=9, depthshade=False))
+        
+        # Fixed support fills share one collection that is created once and refilled
+        offsets = np.zeros((len(fixed_xs), 1, 3))
+        offsets[:, 0, 0] = fixed_xs
+        if self._fixed_poly is None:
+            self._fixed_poly = Poly3DCollection(FIXED_FILL + offsets, alpha=0.7, facecolor='red', animated=True)
+            self.ax.add_collection3d(self._fixed_poly)
+        else:
+            self._fixed_poly.set_verts(FIXED_FILL + offsets)
     
     def draw_loads(self):
         """Draw load arrows"""
-        for load in self.loads:
-            if load['type'] == 'concentrated':
-                x = load['position']
-                magnitude = load['magnitude']
-                
-                # Draw arrow
-                arrow_length = abs(magnitude) * 0.3
+        artists = self._dyn_artists
+        ax = self.ax
+        concentrated = LOAD_TYPE_CODES['concentrated']
+        for code, x, magnitude, start_pos, end_pos, start_intensity, end_intensity in self.load_rows():
+            if code == concentrated:
+                # Add load label; the arrow is drawn in a batch below
                 if magnitude > 0:  # Downward load
-                    self.ax.quiver(x, 0, 1, 0, 0, -arrow_length, 
-                                  color='red', arrow_length_ratio=0.1, linewidth=3)
-                    self.ax.text(x, 0, 1.5, f'{magnitude:.1f} kN', ha='center', color='red', fontweight='bold')
+                    artists.append(ax.text(x, 0, 1.5, f'{magnitude:.1f} kN', ha='center', color='red', fontweight='bold'))
                 else:  # Upward load
-                    self.ax.quiver(x, 0, -1, 0, 0, arrow_length, 
-                                  color='blue', arrow_length_ratio=0.1, linewidth=3)
-                    self.ax.text(x, 0, -1.5, f'{magnitude:.1f} kN', ha='center', color='blue', fontweight='bold')
-                    
-            elif load['type'] in ['distributed', 'varying']:
-                start_pos = load['start_pos']
-                end_pos = load['end_pos']
-                
-                if load['type'] == 'distributed':
-                    intensity = load['intensity']
-                    start_intensity = end_intensity = intensity
-                else:  # varying
-                    start_intensity = load['start_intensity']
-                    end_intensity = load['end_intensity']
-                
-                # Draw multiple arrows for distributed load
-                num_arrows = max(5, int((end_pos - start_pos) * 2))
-                for i in range(num_arrows + 1):
-                    ratio = i / num_arrows if num_arrows > 0 else 0
-                    x = start_pos + ratio * (end_pos - start_pos)
-                    intensity = start_intensity + ratio * (end_intensity - start_intensity)
+                    artists.append(ax.text(x, 0, -1.5, f'{magnitude:.1f} kN', ha='center', color='blue', fontweight='bold'))
                     
-                    arrow_length = abs(intensity) * 0.2
-                    if intensity > 0:  # Downward load
-                        self.ax.quiver(x, 0, 1, 0, 0, -arrow_length, 
-                                      color='orange', arrow_length_ratio=0.2, linewidth=2)
-                    else:  # Upward load
-                        self.ax.quiver(x, 0, -1, 0, 0, arrow_length, 
-                                      color='cyan', arrow_length_ratio=0.2, linewidth=2)
-                
+            else:  # distributed or varying
                 # Add load label
                 mid_x = (start_pos + end_pos) / 2
                 avg_intensity = (start_intensity + end_intensity) / 2
-                self.ax.text(mid_x, 0, 2, f'{avg_intensity:.1f} kN/m', ha='center', 
-                           color='orange', fontweight='bold')
+                artists.append(ax.text(mid_x, 0, 2, f'{avg_intensity:.1f} kN/m', ha='center', 
+                                       color='orange', fontweight='bold'))
+        
+        # Arrows for every concentrated load, computed in one batch
+        arr = self._load_arr
+        point = arr['type'] == concentrated
+        if point.any():
+            magnitudes = arr['mag'][point]
+            arrow_lengths = np.abs(magnitudes) * 0.3
+            
+            # Downward loads point down from z=1, upward loads point up from z=-1
+            down = magnitudes > 0
+            z_tail = np.where(down, 1.0, -1.0)
+            dz = np.where(down, -arrow_lengths, arrow_lengths)
+            shafts, heads = arrow_segments(arr['pos'][point], z_tail, dz, 0.1)
+            colors = np.where(down, 'red', 'blue')
+            self.queue_segments(shafts, colors, 3)
+            self.queue_segments(heads, np.repeat(colors, 2), 3)
+        
+        # Arrows for every distributed and varying load, computed in one batch
+        spread = ~point
+        if spread.any():
+            xs, intensities = arrow_points(arr['start'][spread], arr['end'][spread],
+                                           arr['i0'][spread], arr['i1'][spread])
+            arrow_lengths = np.abs(intensities) * 0.2
+            
+            # Downward loads point down from z=1, upward loads point up from z=-1
+            down = intensities > 0
+            z_tail = np.where(down, 1.0, -1.0)
+            dz = np.where(down, -arrow_lengths, arrow_lengths)
+            shafts, heads = arrow_segments(xs, z_tail, dz, 0.2)
+            colors = np.where(down, 'orange', 'cyan')
+            self.queue_segments(shafts, colors, 2)
+            self.queue_segments(heads, np.repeat(colors, 2), 2)
     
     def update_config_display(self):
         """Update the configuration display"""
@@ -624,25 +857,27 @@ Max Deflection: {results['max_deflection']:.3f} mm
             config_text += f"  {i+1}. {support['type'].upper()} at {support['position']:.1f}m\n"
         
         config_text += f"\nLoads ({len(self.loads)}):\n"
-        for i, load in enumerate(self.loads):
-            if load['type'] == 'concentrated':
-                config_text += f"  {i+1}. Point: {load['magnitude']:.1f}kN at {load['position']:.1f}m\n"
-            elif load['type'] == 'distributed':
-                config_text += f"  {i+1}. Dist: {load['intensity']:.1f}kN/m from {load['start_pos']:.1f}m to {load['end_pos']:.1f}m\n"
-            elif load['type'] == 'varying':
-                config_text += f"  {i+1}. Vary: {load['start_intensity']:.1f}-{load['end_intensity']:.1f}kN/m from {load['start_pos']:.1f}m to {load['end_pos']:.1f}m\n"
-        
-        self.config_text.delete(1.0, tk.END)
-        self.config_text.insert(1.0, config_text)
+        concentrated = LOAD_TYPE_CODES['concentrated']
+        distributed = LOAD_TYPE_CODES['distributed']
+        for i, (code, position, magnitude, start_pos, end_pos, i0, i1) in enumerate(self.load_rows(), 1):
+            if code == concentrated:
+                config_text += f"  {i}. Point: {magnitude:.1f}kN at {position:.1f}m\n"
+            elif code == distributed:
+                config_text += f"  {i}. Dist: {i0:.1f}kN/m from {start_pos:.1f}m to {end_pos:.1f}m\n"
+            else:
+                config_text += f"  {i}. Vary: {i0:.1f}-{i1:.1f}kN/m from {start_pos:.1f}m to {end_pos:.1f}m\n"
+        
+        self.set_readonly_text(self.config_text, config_text)
     
     def clear_all(self):
         """Clear all supports and loads"""
-        self.supports = []
+        self.set_supports([])
         self.loads = []
+        self._load_arr = self.build_load_arrays([])
         self.analysis_results = None
         self.update_visualization()
         self.update_config_display()
-        self.results_text.delete(1.0, tk.END)
+        self.set_readonly_text(self.results_text, "")
         
     def reset_view(self):
         """Reset the 3D view to default"""
@@ -664,8 +899,8 @@ Max Deflection: {results['max_deflection']:.3f} mm
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    json.dump(design_data, f, indent=2)
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(design_data, option=orjson.OPT_INDENT_2))
                 messagebox.showinfo("Success", "Design saved successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save design: {str(e)}")
@@ -678,19 +913,29 @@ Max Deflection: {results['max_deflection']:.3f} mm
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    design_data = json.load(f)
+                with open(filename, 'rb') as f:
+                    design_data = orjson.loads(f.read())
+                
+                beam_length = design_data.get('beam_length', 10.0)
+                loads = design_data.get('loads', [])
+                load_arr = self.build_load_arrays(loads)
+                
+                # Validate every load in one vectorized pass before touching the current design
+                invalid = np.flatnonzero(invalid_loads(load_arr, beam_length))
+                if invalid.size:
+                    raise ValueError(f"Invalid parameters for load {invalid[0] + 1}")
                 
-                self.beam_length = design_data.get('beam_length', 10.0)
-                self.supports = design_data.get('supports', [])
-                self.loads = design_data.get('loads', [])
+                self.beam_length = beam_length
+                self.set_supports(design_data.get('supports', []))
+                self.loads = loads
+                self._load_arr = load_arr
                 
                 # Update GUI
                 self.length_var.set(self.beam_length)
                 self.analysis_results = None
                 self.update_visualization()
                 self.update_config_display()
-                self.results_text.delete(1.0, tk.END)
+                self.set_readonly_text(self.results_text, "")
                 
                 messagebox.showinfo("Success", "Design loaded successfully!")
                 
@@ -706,21 +951,125 @@ Max Deflection: {results['max_deflection']:.3f} mm
         self.create_charts_window()
     
     def create_charts_window(self):
-        """Create a new window with 2D charts"""
+        """Create a new window with 2D charts, or raise and refill the open one"""
+        # The figure can only be embedded in one canvas at a time
+        if self._chart_window is not None:
+            self.refresh_charts()
+            self._chart_window.deiconify()
+            self._chart_window.lift()
+            return
+            
         chart_window = tk.Toplevel(self.root)
         chart_window.title("📈 Beam Analysis Charts")
         chart_window.geometry("900x700")
         chart_window.configure(bg=self.colors['bg'])
         
-        # Create figure with subplots
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8), facecolor='#0a1428')
+        # The figure is built once and refilled with the current design on every open
+        if self._chart_fig is None:
+            self.create_charts_figure()
+        fig = self._chart_fig
+        self.fill_charts()
+        
+        # Embed the plots in the tkinter window; closing it leaves the figure intact
+        canvas = FigureCanvasTkAgg(fig, chart_window)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        draw_cid = canvas.mpl_connect('draw_event', self.on_charts_draw)
+        canvas.get_tk_widget().bind('<Destroy>', lambda event: self.forget_chart_canvas(canvas, draw_cid))
+        self._chart_window = chart_window
+        self._chart_canvas = canvas
+        self._chart_backgrounds = None
+        fig.tight_layout()
+        
+        # Add close button
+        close_btn = tk.Button(chart_window, text="Close", bg=self.colors['danger'],
+                             fg='white', font=("Segoe UI", 10, "bold"),
+                             command=chart_window.destroy)
+        close_btn.pack(pady=10)
+    
+    def fill_charts(self):
+        """Fill the charts figure with the current diagrams and rescale its axes"""
+        fig = self._chart_fig
+        ax1, ax2, ax3, ax4 = fig.axes
+        
+        for artist in self._chart_artists:
+            artist.remove()
+        self._chart_artists.clear()
+        
+        # Diagram values, reused if the design has not changed since the last open
+        x, load_values, shear_values, moment_values, deflection_values = self.diagram_values()
+        
+        self.plot_load_diagram(ax1, x, load_values)
+        self.plot_shear_diagram(ax2, x, shear_values)
+        self.plot_moment_diagram(ax3, x, moment_values)
+        self.plot_deflection_diagram(ax4, x, deflection_values)
+        
+        # Mark supports
+        support_segments = [[(p, 0), (p, 1)] for p in self._support_positions.tolist()]
+        for markers in self._chart_markers:
+            markers.set_segments(support_segments)
         
-        # Generate x coordinates for plotting
-        x = np.linspace(0, self.beam_length, 100)
+        # Curves and per-design artists are blitted over cached axes backgrounds
+        for artist in self._chart_artists:
+            artist.set_animated(True)
+        
+        for ax in fig.axes:
+            ax.relim()
+            ax.autoscale_view()
+    
+    def refresh_charts(self):
+        """Update an open charts window in place after a new analysis"""
+        canvas = self._chart_canvas
+        if canvas is None:
+            return
+            
+        fig = self._chart_fig
+        limits = [(ax.get_xlim(), ax.get_ylim()) for ax in fig.axes]
+        self.fill_charts()
+        
+        # Ticks and labels are part of the cached background, so new limits need a full redraw
+        if self._chart_backgrounds is None or limits != [(ax.get_xlim(), ax.get_ylim()) for ax in fig.axes]:
+            fig.tight_layout()
+            canvas.draw_idle()
+            return
+            
+        for ax, background in zip(fig.axes, self._chart_backgrounds):
+            canvas.restore_region(background)
+            for artist in self.chart_dynamic_artists(ax):
+                ax.draw_artist(artist)
+            canvas.blit(ax.bbox)
+    
+    def on_charts_draw(self, event):
+        """Cache the axes backgrounds after a full charts redraw and overlay the curves"""
+        fig = self._chart_fig
+        self._chart_backgrounds = [self._chart_canvas.copy_from_bbox(ax.bbox) for ax in fig.axes]
+        for ax in fig.axes:
+            for artist in self.chart_dynamic_artists(ax):
+                ax.draw_artist(artist)
+    
+    def chart_dynamic_artists(self, ax):
+        """Return the animated artists of one chart axis in drawing order"""
+        artists = [*self._chart_fills.values(), *self._chart_lines.values(),
+                   *self._chart_markers, *self._chart_artists]
+        return sorted((a for a in artists if a.axes is ax), key=lambda a: a.get_zorder())
+    
+    def forget_chart_canvas(self, canvas, draw_cid):
+        """Stop updating a charts canvas once its window is closed"""
+        # The draw_event registry lives on the persistent figure, so drop this window's handler
+        canvas.mpl_disconnect(draw_cid)
+        if self._chart_canvas is canvas:
+            self._chart_window = None
+            self._chart_canvas = None
+            self._chart_backgrounds = None
+    
+    def create_charts_figure(self):
+        """Create the persistent charts figure with one empty curve per diagram"""
+        fig = Figure(figsize=(12, 8), facecolor='#0a1428')
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         
         # Plot 1: Load diagram
         ax1.set_facecolor('#001428')
-        self.plot_load_diagram(ax1, x)
+        self._chart_lines['load'], = ax1.plot([], [], 'orange', linewidth=2, label='Distributed Load', animated=True)
+        self._chart_fills['load'], = ax1.fill([], [], alpha=0.3, color='orange', linewidth=0, animated=True)
         ax1.set_title('Load Diagram', color=self.colors['accent'], fontweight='bold')
         ax1.set_xlabel('Position (m)', color=self.colors['secondary'])
         ax1.set_ylabel('Load (kN/m)', color=self.colors['secondary'])
@@ -729,7 +1078,9 @@ Max Deflection: {results['max_deflection']:.3f} mm
         
         # Plot 2: Shear force diagram (simplified)
         ax2.set_facecolor('#001428')
-        self.plot_shear_diagram(ax2, x)
+        self._chart_lines['shear'], = ax2.plot([], [], 'blue', linewidth=2, animated=True)
+        self._chart_fills['shear'], = ax2.fill([], [], alpha=0.3, color='blue', linewidth=0, animated=True)
+        ax2.axhline(y=0, color='black', linestyle='-', alpha=0.5)
         ax2.set_title('Shear Force Diagram', color=self.colors['accent'], fontweight='bold')
         ax2.set_xlabel('Position (m)', color=self.colors['secondary'])
         ax2.set_ylabel('Shear Force (kN)', color=self.colors['secondary'])
@@ -738,7 +1089,9 @@ Max Deflection: {results['max_deflection']:.3f} mm
         
         # Plot 3: Bending moment diagram (simplified)
         ax3.set_facecolor('#001428')
-        self.plot_moment_diagram(ax3, x)
+        self._chart_lines['moment'], = ax3.plot([], [], 'purple', linewidth=2, animated=True)
+        self._chart_fills['moment'], = ax3.fill([], [], alpha=0.3, color='purple', linewidth=0, animated=True)
+        ax3.axhline(y=0, color='black', linestyle='-', alpha=0.5)
         ax3.set_title('Bending Moment Diagram', color=self.colors['accent'], fontweight='bold')
         ax3.set_xlabel('Position (m)', color=self.colors['secondary'])
         ax3.set_ylabel('Moment (kN⋅m)', color=self.colors['secondary'])
@@ -747,150 +1100,122 @@ Max Deflection: {results['max_deflection']:.3f} mm
         
         # Plot 4: Deflection diagram (simplified)
         ax4.set_facecolor('#001428')
-        self.plot_deflection_diagram(ax4, x)
+        self._chart_lines['deflection'], = ax4.plot([], [], 'red', linewidth=2, animated=True)
+        self._chart_fills['deflection'], = ax4.fill([], [], alpha=0.3, color='red', linewidth=0, animated=True)
+        ax4.axhline(y=0, color='black', linestyle='-', alpha=0.5)
         ax4.set_title('Deflection Diagram', color=self.colors['accent'], fontweight='bold')
         ax4.set_xlabel('Position (m)', color=self.colors['secondary'])
         ax4.set_ylabel('Deflection (mm)', color=self.colors['secondary'])
         ax4.tick_params(colors=self.colors['secondary'])
         ax4.grid(True, alpha=0.3, color=self.colors['secondary'])
         
-        plt.tight_layout()
-        
-        # Embed the plots in the tkinter window
-        canvas = FigureCanvasTkAgg(fig, chart_window)
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        # Dashed support markers spanning the full height of every diagram
+        for ax in (ax1, ax2, ax3, ax4):
+            markers = LineCollection([], colors='green', linestyles='--', alpha=0.7,
+                                     transform=ax.get_xaxis_transform(), animated=True)
+            self._chart_markers.append(ax.add_collection(markers, autolim=False))
         
-        # Add close button
-        close_btn = tk.Button(chart_window, text="Close", bg=self.colors['danger'],
-                             fg='white', font=("Segoe UI", 10, "bold"),
-                             command=chart_window.destroy)
-        close_btn.pack(pady=10)
+        self._chart_fig = fig
     
-    def plot_load_diagram(self, ax, x):
-        """Plot the load diagram"""
+    def diagram_values(self, npoints=None):
+        """Return x and the load, shear, moment and deflection values, reused while the design is unchanged"""
+        npoints = npoints or self.chart_points
+        
+        # Current inputs plus the inputs the analysis results were computed from
+        key = (self.analysis_key(), self._analysis_key, npoints)
+        if self._diagram_cache is None or self._diagram_cache[0] != key:
+            x = x_grid(float(self.beam_length), npoints)
+            values = (x, *self.compute_diagrams(x))
+            self._diagram_cache = (key, values)
+        return self._diagram_cache[1]
+    
+    def load_values(self, x):
+        """Compute the distributed load intensity along the beam"""
         load_values = np.zeros_like(x)
         
-        for load in self.loads:
-            if load['type'] == 'concentrated':
-                # Find closest point to load position
-                idx = np.argmin(np.abs(x - load['position']))
-                if idx < len(load_values):
-                    # Show as impulse
-                    ax.arrow(load['position'], 0, 0, load['magnitude'], 
-                            head_width=self.beam_length*0.02, head_length=abs(load['magnitude'])*0.1,
-                            fc='red', ec='red')
-                    
-            elif load['type'] == 'distributed':
-                mask = (x >= load['start_pos']) & (x <= load['end_pos'])
-                load_values[mask] = load['intensity']
-                
-            elif load['type'] == 'varying':
-                mask = (x >= load['start_pos']) & (x <= load['end_pos'])
-                length = load['end_pos'] - load['start_pos']
-                if length > 0:
-                    for i, pos in enumerate(x[mask]):
-                        ratio = (pos - load['start_pos']) / length
-                        intensity = load['start_intensity'] + ratio * (load['end_intensity'] - load['start_intensity'])
-                        load_values[mask][i] = intensity
-        
-        ax.plot(x, load_values, 'orange', linewidth=2, label='Distributed Load')
-        ax.fill_between(x, 0, load_values, alpha=0.3, color='orange')
-        
-        # Mark supports
-        for support in self.supports:
-            ax.axvline(x=support['position'], color='green', linestyle='--', alpha=0.7)
-            ax.text(support['position'], max(load_values)*0.1, support['type'].upper(), 
-                   rotation=90, ha='right', va='bottom', color='green', fontweight='bold')
+        # Distributed and varying loads; a distributed load is a ramp with equal
+        # start and end intensity. x is sorted, so each load covers x[lo:hi].
+        arr = self._load_arr
+        spread = arr['type'] != LOAD_TYPE_CODES['concentrated']
+        start, end = arr['start'][spread], arr['end'][spread]
+        lo = np.searchsorted(x, start, 'left')
+        hi = np.searchsorted(x, end, 'right')
+        for a, b, sp, ep, i0, i1 in zip(lo.tolist(), hi.tolist(), start.tolist(), end.tolist(),
+                                        arr['i0'][spread].tolist(), arr['i1'][spread].tolist()):
+            load_values[a:b] += i0 + (x[a:b] - sp) / (ep - sp) * (i1 - i0)
+        
+        return load_values
     
-    def plot_shear_diagram(self, ax, x):
-        """Plot simplified shear force diagram"""
-        if not self.analysis_results:
-            return
-            
+    def compute_diagrams(self, x):
+        """Compute the load, shear, moment and deflection values in one pass over x"""
+        load_values = self.load_values(x)
         shear_values = np.zeros_like(x)
+        moment_values = np.zeros_like(x)
+        deflection_values = np.zeros_like(x)
+        if not self.analysis_results or len(self.supports) < 2:
+            return load_values, shear_values, moment_values, deflection_values
         
-        # This is a simplified shear diagram
-        # In reality, this would require more complex calculations
-        total_load = self.analysis_results['total_load']
-        
-        # Simple approximation: linear variation between supports
-        if len(self.supports) >= 2:
-            support_positions = sorted([s['position'] for s in self.supports])
-            reactions = self.analysis_results['reactions']
-            
-            current_shear = reactions[0] if len(reactions) > 0 else 0
-            
-            for i, pos in enumerate(x):
-                if pos <= support_positions[0]:
-                    shear_values[i] = 0
-                elif len(support_positions) > 1 and pos <= support_positions[1]:
-                    # Between first and second support
-                    progress = (pos - support_positions[0]) / (support_positions[1] - support_positions[0])
-                    shear_values[i] = current_shear * (1 - progress)
-                else:
-                    shear_values[i] = 0
+        # These are simplified diagrams
+        # In reality, they would require more complex calculations
+        p0, p1 = self._support_positions[:2].tolist()
+        span = p1 - p0
+        if span <= 0:
+            return load_values, shear_values, moment_values, deflection_values
         
-        ax.plot(x, shear_values, 'blue', linewidth=2)
-        ax.fill_between(x, 0, shear_values, alpha=0.3, color='blue')
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+        # Relative position across the first span, shared by every curve; all
+        # three are zero at the first support and outside the span
+        gate = (x > p0) & (x <= p1)
+        r = (x[gate] - p0) / span
         
-        # Mark supports
-        for support in self.supports:
-            ax.axvline(x=support['position'], color='green', linestyle='--', alpha=0.7)
-    
-    def plot_moment_diagram(self, ax, x):
-        """Plot simplified bending moment diagram"""
-        if not self.analysis_results:
-            return
-            
-        moment_values = np.zeros_like(x)
+        results = self.analysis_results
+        reactions = results['reactions']
         
-        # Simplified moment diagram - parabolic approximation
-        max_moment = self.analysis_results['max_moment']
+        # Shear: linear decay from the first reaction
+        current_shear = reactions[0] if len(reactions) > 0 else 0
+        shear_values[gate] = current_shear * (1 - r)
         
-        if len(self.supports) >= 2:
-            support_positions = sorted([s['position'] for s in self.supports])
-            span = support_positions[1] - support_positions[0] if len(support_positions) > 1 else self.beam_length
-            
-            for i, pos in enumerate(x):
-                if support_positions[0] <= pos <= support_positions[1] if len(support_positions) > 1 else 0 <= pos <= self.beam_length:
-                    # Parabolic approximation
-                    relative_pos = (pos - support_positions[0]) / span if span > 0 else 0
-                    moment_values[i] = max_moment * 4 * relative_pos * (1 - relative_pos)
+        # Moment: parabolic approximation
+        parabola = r * (1 - r)
+        moment_values[gate] = results['max_moment'] * 4 * parabola
         
-        ax.plot(x, moment_values, 'purple', linewidth=2)
-        ax.fill_between(x, 0, moment_values, alpha=0.3, color='purple')
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+        # Deflection: simplified curve, max_deflection in mm
+        deflection_values[gate] = -results['max_deflection'] * parabola * (1 - 2*r + 2*r**2)
         
-        # Mark supports
-        for support in self.supports:
-            ax.axvline(x=support['position'], color='green', linestyle='--', alpha=0.7)
+        return load_values, shear_values, moment_values, deflection_values
     
-    def plot_deflection_diagram(self, ax, x):
-        """Plot simplified deflection diagram"""
-        if not self.analysis_results:
-            return
-            
-        deflection_values = np.zeros_like(x)
-        max_deflection = self.analysis_results['max_deflection']  # in mm
-        
-        if len(self.supports) >= 2:
-            support_positions = sorted([s['position'] for s in self.supports])
-            span = support_positions[1] - support_positions[0] if len(support_positions) > 1 else self.beam_length
-            
-            for i, pos in enumerate(x):
-                if support_positions[0] <= pos <= support_positions[1] if len(support_positions) > 1 else 0 <= pos <= self.beam_length:
-                    # Simplified deflection curve
-                    relative_pos = (pos - support_positions[0]) / span if span > 0 else 0
-                    deflection_values[i] = -max_deflection * relative_pos * (1 - relative_pos) * (1 - 2*relative_pos + 2*relative_pos**2)
+    def plot_load_diagram(self, ax, x, load_values):
+        """Plot the load diagram"""
+        artists = self._chart_artists
+        for load in self.loads:
+            if load['type'] == 'concentrated':
+                # Show as impulse
+                artists.append(ax.arrow(load['position'], 0, 0, load['magnitude'], 
+                                        head_width=self.beam_length*0.02, head_length=abs(load['magnitude'])*0.1,
+                                        fc='red', ec='red'))
         
-        ax.plot(x, deflection_values, 'red', linewidth=2)
-        ax.fill_between(x, 0, deflection_values, alpha=0.3, color='red')
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+        self._chart_lines['load'].set_data(x, load_values)
+        self._chart_fills['load'].set_xy(area_vertices(x, load_values))
         
-        # Mark supports
+        # Label supports
+        y_anchor = float(load_values.max()) * 0.1
         for support in self.supports:
-            ax.axvline(x=support['position'], color='green', linestyle='--', alpha=0.7)
+            artists.append(ax.text(support['position'], y_anchor, support['type'].upper(), 
+                                   rotation=90, ha='right', va='bottom', color='green', fontweight='bold'))
+    
+    def plot_shear_diagram(self, ax, x, shear_values):
+        """Plot simplified shear force diagram"""
+        self._chart_lines['shear'].set_data(x, shear_values)
+        self._chart_fills['shear'].set_xy(area_vertices(x, shear_values))
+    
+    def plot_moment_diagram(self, ax, x, moment_values):
+        """Plot simplified bending moment diagram"""
+        self._chart_lines['moment'].set_data(x, moment_values)
+        self._chart_fills['moment'].set_xy(area_vertices(x, moment_values))
+    
+    def plot_deflection_diagram(self, ax, x, deflection_values):
+        """Plot simplified deflection diagram"""
+        self._chart_lines['deflection'].set_data(x, deflection_values)
+        self._chart_fills['deflection'].set_xy(area_vertices(x, deflection_values))
 
 
 def main():
@@ -5,145 +5,98 @@ from ttkbootstrap.constants import *
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import numpy as np
 import matplotlib.patches as patches
+from matplotlib.collections import LineCollection
 from matplotlib.animation import FuncAnimation
 import threading
+import queue
 import time
-from dataclasses import dataclass
-from typing import List, Dict, Tuple
-import json
+import math
+import functools
+from dataclasses import asdict
+from typing import Dict
+import orjson
 
-# Enhanced beam analysis classes
-@dataclass
-class Support:
-    position: float
-    type: str = "pin"  # pin, roller, fixed
+from beam_engine import AdvancedBeamEngine, BeamProperties, Support, ConcentratedLoad, UniformlyVaryingLoad
 
-@dataclass
-class ConcentratedLoad:
-    position: float
-    magnitude: float
-    angle: float = -90  # degrees from horizontal
+# Fixed colour ramps of the 3D view, sampled from their colormaps once
+ROLLER_RING_COLORS = np.repeat(plt.cm.rainbow(np.arange(3) / 2), 5, axis=0)  # 3 rollers x 5 rings
+ARROW_SHAFT_COLORS = plt.cm.plasma(np.linspace(0, 1, 10))[:9]  # one per shaft segment
+ARROW_TIP_COLOR = plt.cm.plasma(0.8)
 
-@dataclass
-class UniformlyVaryingLoad:
-    start_pos: float
-    end_pos: float
-    start_magnitude: float
-    end_magnitude: float
+@functools.lru_cache(maxsize=8)
+def beam_geometry(length: float, width: float, height: float) -> Dict[str, np.ndarray]:
+    """Outline, surface mesh and face colours of the 3D beam, shared read-only between redraws."""
+    geometry = {
+        'x_beam': np.array([0, length, length, 0, 0]),
+        'y_beam': np.array([-width/2, -width/2, width/2, width/2, -width/2]),
+        'z_bottom': np.zeros(5),
+        'z_top': np.ones(5) * height,
+    }
+    
+    xx = np.linspace(0, length, 50)
+    yy = np.linspace(-width/2, width/2, 20)
+    XX, YY = np.meshgrid(xx, yy)
+    geometry.update(
+        XX=XX, YY=YY,
+        ZZ_top=np.ones_like(XX) * height,
+        ZZ_bottom=np.zeros_like(XX),
+        # One colour per row of faces
+        facecolors_top=np.broadcast_to(
+            plt.cm.plasma(np.linspace(0.3, 0.8, len(yy)))[:, None], XX.shape + (4,)),
+        facecolors_bottom=np.broadcast_to(
+            plt.cm.viridis(np.linspace(0.2, 0.7, len(yy)))[:, None], XX.shape + (4,)))
+    
+    for array in geometry.values():
+        array.flags.writeable = False
+    return geometry
 
-@dataclass
-class BeamProperties:
-    length: float
-    elastic_modulus: float = 200e9  # Pa
-    moment_of_inertia: float = 8.33e-6  # m^4
-    cross_section_area: float = 0.01  # m^2
-    density: float = 7850  # kg/m^3
+# Fixed layout of the results texts, filled in with format_map on every analysis
+SUMMARY_TEMPLATE = """
+╔══════════════════════════════════════╗
+║          BEAM ANALYSIS SUMMARY        ║
+╠══════════════════════════════════════╣
+║ Beam Length: {length:.2f} m              ║
+║ Material: {material}                     ║
+║ E: {E_GPa:.1f} GPa                      ║
+║ I: {I:.2e} m⁴       ║
+╠══════════════════════════════════════╣
+║            CRITICAL VALUES            ║
+╠══════════════════════════════════════╣
+║ Max Moment: {max_moment_kNm:.2f} kN⋅m          ║
+║ Max Shear: {max_shear_kN:.2f} kN             ║
+║ Max Deflection: {max_deflection_mm:.3f} mm      ║
+║ Max Stress: {max_stress_MPa:.2f} MPa            ║
+╠══════════════════════════════════════╣
+║              SUPPORTS                 ║
+╠══════════════════════════════════════╣"""
 
-class AdvancedBeamEngine:
-    def __init__(self, beam_props: BeamProperties):
-        self.beam_props = beam_props
-        self.supports: List[Support] = []
-        self.concentrated_loads: List[ConcentratedLoad] = []
-        self.varying_loads: List[UniformlyVaryingLoad] = []
-        self.results = {}
-        
-    def add_support(self, support: Support):
-        self.supports.append(support)
-        
-    def add_concentrated_load(self, load: ConcentratedLoad):
-        self.concentrated_loads.append(load)
-        
-    def add_varying_load(self, load: UniformlyVaryingLoad):
-        self.varying_loads.append(load)
-        
-    def analyze(self):
-        """Comprehensive beam analysis with enhanced calculations"""
-        x = np.linspace(0, self.beam_props.length, 1000)
-        
-        # Initialize arrays
-        shear = np.zeros_like(x)
-        moment = np.zeros_like(x)
-        deflection = np.zeros_like(x)
-        stress = np.zeros_like(x)
-        
-        # Calculate reactions at supports
-        reactions = self._calculate_reactions()
-        
-        # Apply concentrated loads
-        for load in self.concentrated_loads:
-            load_idx = np.argmin(np.abs(x - load.position))
-            for i in range(load_idx, len(x)):
-                shear[i] += load.magnitude * np.sin(np.radians(load.angle))
-                
-        # Apply varying loads
-        for load in self.varying_loads:
-            start_idx = np.argmin(np.abs(x - load.start_pos))
-            end_idx = np.argmin(np.abs(x - load.end_pos))
-            
-            for i in range(start_idx, end_idx + 1):
-                pos_ratio = (x[i] - load.start_pos) / (load.end_pos - load.start_pos)
-                load_mag = load.start_magnitude + pos_ratio * (load.end_magnitude - load.start_magnitude)
-                shear[i] += load_mag
-                
-        # Apply support reactions
-        for support, reaction in zip(self.supports, reactions):
-            support_idx = np.argmin(np.abs(x - support.position))
-            for i in range(support_idx, len(x)):
-                shear[i] -= reaction
-                
-        # Calculate moment from shear
-        dx = x[1] - x[0]
-        for i in range(1, len(moment)):
-            moment[i] = moment[i-1] + shear[i-1] * dx
-            
-        # Calculate deflection using moment-area method
-        EI = self.beam_props.elastic_modulus * self.beam_props.moment_of_inertia
-        for i in range(1, len(deflection)):
-            deflection[i] = deflection[i-1] + moment[i-1] * dx / EI
-            
-        # Calculate stress
-        y_max = 0.1  # Assume beam height
-        stress = moment * y_max / self.beam_props.moment_of_inertia
-        
-        self.results = {
-            'x': x,
-            'shear': shear,
-            'moment': moment,
-            'deflection': deflection,
-            'stress': stress,
-            'reactions': reactions,
-            'max_moment': np.max(np.abs(moment)),
-            'max_deflection': np.max(np.abs(deflection)),
-            'max_stress': np.max(np.abs(stress))
-        }
-        
-        return self.results
-        
-    def _calculate_reactions(self):
-        """Calculate support reactions using equilibrium equations"""
-        if len(self.supports) < 2:
-            return [0] * len(self.supports)
-            
-        # Simple calculation for two supports
-        total_load = sum(load.magnitude for load in self.concentrated_loads)
-        for load in self.varying_loads:
-            avg_load = (load.start_magnitude + load.end_magnitude) / 2
-            load_length = load.end_pos - load.start_pos
-            total_load += avg_load * load_length
-            
-        if len(self.supports) == 2:
-            # For two supports, distribute load based on position
-            L = self.beam_props.length
-            a = self.supports[0].position
-            b = self.supports[1].position
-            
-            R1 = total_load * (L - a) / (b - a) * 0.5
-            R2 = total_load - R1
-            return [R1, R2]
-            
-        return [total_load / len(self.supports)] * len(self.supports)
+DETAILED_TEMPLATE = """
+DEFLECTION ANALYSIS:
+--------------------
+Maximum Deflection: {max_deflection_mm:.3f} mm
+Location of Max Deflection: {max_deflection_x:.2f} m
+Deflection Limit (L/250): {deflection_limit_mm:.3f} mm
+
+STRESS ANALYSIS:
+--------------------
+Maximum Stress: {max_stress_MPa:.2f} MPa
+Allowable Stress (Steel): 250 MPa
+Safety Factor: {safety_factor:.2f}
+
+MOMENT ANALYSIS:
+--------------------
+Maximum Positive Moment: {max_positive_moment_kNm:.2f} kN⋅m
+Maximum Negative Moment: {max_negative_moment_kNm:.2f} kN⋅m
+Location of Max Moment: {max_moment_x:.2f} m
+
+SHEAR ANALYSIS:
+--------------------
+Maximum Shear: {max_shear_kN:.2f} kN
+Critical Shear Locations: Multiple points analyzed
+"""
 
 class Advanced3DBeamGUI(tb.Window):
     def __init__(self):
@@ -155,8 +108,15 @@ class Advanced3DBeamGUI(tb.Window):
         # Initialize variables before they're used
         self.beam_engine = None
         self.animation_running = False
-        self.analysis_thread = None
         self.stop_analysis = False
+        self.pending_analysis = None
+        self.float_cache = {}
+        self.diagram_artists = None
+        
+        # Single long-lived analysis worker; the queue holds at most the latest request
+        self.analysis_requests = queue.Queue(maxsize=1)
+        self.analysis_thread = threading.Thread(target=self.analysis_worker, daemon=True)
+        self.analysis_thread.start()
         self.auto_analyze = tk.BooleanVar(value=True)
         self.results_panel_visible = tk.BooleanVar(value=True)
         self.results_panel = None
@@ -266,7 +226,7 @@ class Advanced3DBeamGUI(tb.Window):
             var = tk.StringVar(value="10" if "Length" in label else "0.1")
             entry = tb.Entry(props_frame, textvariable=var, bootstyle="info")
             entry.grid(row=i, column=1, sticky="ew", pady=2, padx=(5,0))
-            self.property_vars[var_name] = var
+            self.property_vars[var_name] = self.watch_float(var, var_name)
             
         props_frame.grid_columnconfigure(1, weight=1)
         
@@ -287,7 +247,7 @@ class Advanced3DBeamGUI(tb.Window):
         self.support_type_combo.set("Pin")
         
         tb.Label(supports_frame, text="Position (m):").grid(row=1, column=0, sticky="w", pady=2)
-        self.support_pos_var = tk.StringVar()
+        self.support_pos_var = self.watch_float(tk.StringVar(), "support_pos")
         support_pos_entry = tb.Entry(supports_frame, textvariable=self.support_pos_var, bootstyle="warning")
         support_pos_entry.grid(row=1, column=1, sticky="ew", pady=2, padx=(5,0))
         
@@ -538,17 +498,36 @@ class Advanced3DBeamGUI(tb.Window):
             var = tk.StringVar(value=default)
             entry = tb.Entry(self.load_params_frame, textvariable=var, bootstyle="danger", width=15)
             entry.grid(row=i, column=1, sticky="ew", pady=1, padx=(5,0))
-            self.load_vars[var_name] = var
+            self.load_vars[var_name] = self.watch_float(var, f"load_{var_name}")
             
         self.load_params_frame.grid_columnconfigure(1, weight=1)
         
+    def watch_float(self, var, key):
+        """Parse a numeric StringVar whenever it is written, caching the value or the parse error"""
+        def cache(*args):
+            try:
+                self.float_cache[key] = float(var.get())
+            except ValueError as e:
+                self.float_cache[key] = e
+                
+        var.trace_add("write", cache)
+        cache()
+        return var
+        
+    def cached_float(self, key):
+        """Return the cached value of a numeric input, raising ValueError if it is not a number"""
+        value = self.float_cache[key]
+        if isinstance(value, ValueError):
+            raise value
+        return value
+        
     def create_advanced_beam(self):
         """Create beam with advanced properties"""
         try:
-            length = float(self.property_vars["beam_length"].get())
-            height = float(self.property_vars["beam_height"].get())
-            width = float(self.property_vars["beam_width"].get())
-            E = float(self.property_vars["elastic_modulus"].get()) * 1e9  # Convert GPa to Pa
+            length = self.cached_float("beam_length")
+            height = self.cached_float("beam_height")
+            width = self.cached_float("beam_width")
+            E = self.cached_float("elastic_modulus") * 1e9  # Convert GPa to Pa
             
             # Calculate moment of inertia for rectangular cross-section
             I = (width * height**3) / 12
@@ -575,7 +554,7 @@ class Advanced3DBeamGUI(tb.Window):
             return
             
         try:
-            pos = float(self.support_pos_var.get())
+            pos = self.cached_float("support_pos")
             support_type = self.support_type_combo.get().lower()
             
             support = Support(position=pos, type=support_type)
@@ -586,7 +565,7 @@ class Advanced3DBeamGUI(tb.Window):
             self.update_status(f"➕ {support_type.title()} support added at {pos}m")
             
             if self.auto_analyze.get():
-                self.analyze_beam()
+                self.schedule_analysis()
                 
         except ValueError:
             messagebox.showerror("Input Error", "Invalid position value!")
@@ -601,7 +580,7 @@ class Advanced3DBeamGUI(tb.Window):
             self.update_status("❌ Support removed")
             
             if self.auto_analyze.get():
-                self.analyze_beam()
+                self.schedule_analysis()
                 
     def add_load(self):
         """Add load to beam"""
@@ -613,19 +592,19 @@ class Advanced3DBeamGUI(tb.Window):
             load_type = self.load_type_combo.get()
             
             if load_type == "Concentrated":
-                pos = float(self.load_vars["pos"].get())
-                mag = float(self.load_vars["mag"].get()) * 1000  # Convert kN to N
-                angle = float(self.load_vars["angle"].get())
+                pos = self.cached_float("load_pos")
+                mag = self.cached_float("load_mag") * 1000  # Convert kN to N
+                angle = self.cached_float("load_angle")
                 
                 load = ConcentratedLoad(position=pos, magnitude=mag, angle=angle)
                 self.beam_engine.add_concentrated_load(load)
                 self.load_listbox.insert(tk.END, f"Conc: {mag/1000:.1f}kN @ {pos}m")
                 
             elif load_type == "Uniformly Varying":
-                start_pos = float(self.load_vars["start_pos"].get())
-                end_pos = float(self.load_vars["end_pos"].get())
-                start_mag = float(self.load_vars["start_mag"].get()) * 1000
-                end_mag = float(self.load_vars["end_mag"].get()) * 1000
+                start_pos = self.cached_float("load_start_pos")
+                end_pos = self.cached_float("load_end_pos")
+                start_mag = self.cached_float("load_start_mag") * 1000
+                end_mag = self.cached_float("load_end_mag") * 1000
                 
                 load = UniformlyVaryingLoad(start_pos=start_pos, end_pos=end_pos,
                                           start_magnitude=start_mag, end_magnitude=end_mag)
@@ -635,7 +614,7 @@ class Advanced3DBeamGUI(tb.Window):
             self.update_status(f"⚡ {load_type} load added")
             
             if self.auto_analyze.get():
-                self.analyze_beam()
+                self.schedule_analysis()
                 
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid input: {e}")
@@ -656,12 +635,23 @@ class Advanced3DBeamGUI(tb.Window):
             self.update_status("🗑️ Load removed")
             
             if self.auto_analyze.get():
-                self.analyze_beam()
+                self.schedule_analysis()
                 
     def auto_analyze_callback(self, *args):
         """Callback for auto-analysis"""
         if not hasattr(self, 'auto_analyze') or not self.auto_analyze.get():
             return
+        self.schedule_analysis()
+        
+    def schedule_analysis(self, delay=150):
+        """Queue an analysis, restarting the wait on every call so a burst of edits runs it once"""
+        if self.pending_analysis is not None:
+            self.after_cancel(self.pending_analysis)
+        self.pending_analysis = self.after(delay, self.run_scheduled_analysis)
+        
+    def run_scheduled_analysis(self):
+        """Run the analysis queued by schedule_analysis"""
+        self.pending_analysis = None
         try:
             self.analyze_beam()
         except Exception as e:
@@ -677,31 +667,44 @@ class Advanced3DBeamGUI(tb.Window):
         self.progress.start()
         self.update_status("🧮 Analyzing beam structure...")
         
+        # Hand the analysis to the worker thread, replacing any request it
+        # has not picked up yet since that one is already stale
         try:
-            # Run analysis in separate thread for better performance
-            def analysis_thread():
-                results = self.beam_engine.analyze()
-                self.after(0, lambda: self.analysis_complete(results))
+            self.analysis_requests.get_nowait()
+        except queue.Empty:
+            pass
+        self.analysis_requests.put(self.beam_engine)
+        
+    def analysis_worker(self):
+        """Run queued analyses off the Tk thread and report back through after()"""
+        while True:
+            engine = self.analysis_requests.get()
+            try:
+                results = engine.analyze()
+            except Exception as e:
+                self.after(0, lambda e=e: self.analysis_failed(e))
+            else:
+                self.after(0, lambda results=results: self.analysis_complete(results))
                 
-            threading.Thread(target=analysis_thread, daemon=True).start()
-            
-        except Exception as e:
-            self.progress.stop()
-            messagebox.showerror("Analysis Error", f"Error during analysis: {e}")
+    def analysis_failed(self, error):
+        """Report an analysis error raised on the worker thread"""
+        self.progress.stop()
+        messagebox.showerror("Analysis Error", f"Error during analysis: {error}")
             
     def analysis_complete(self, results):
         """Handle analysis completion and update all visualizations"""
         self.progress.stop()
         self.update_status("✅ Analysis complete - Updating visualizations...")
         
-        # Update all visualizations
-        self.update_3d_visualization()
-        self.update_analysis_plots()
+        # Update all visualizations, then draw the figure once
+        self.update_3d_visualization(draw=False)
+        self.update_analysis_plots(draw=False)
+        self.canvas.draw_idle()
         self.update_results_display()
         
         self.update_status("🎯 Ready - Interactive 3D visualization updated!")
         
-    def update_3d_visualization(self):
+    def update_3d_visualization(self, draw=True):
         """Create stunning 3D beam visualization with advanced graphics"""
         # Clear previous plots
         self.ax_3d.clear()
@@ -710,19 +713,18 @@ class Advanced3DBeamGUI(tb.Window):
             self.ax_3d.text(0.5, 0.5, 0.5, "Create Beam to Start Analysis", 
                            fontsize=16, ha='center', va='center', color='white',
                            transform=self.ax_3d.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
             
         # Enhanced 3D beam rendering with realistic materials
         length = self.beam_engine.beam_props.length
-        height = float(self.property_vars.get("beam_height", tk.StringVar(value="0.3")).get())
-        width = float(self.property_vars.get("beam_width", tk.StringVar(value="0.2")).get())
+        height = self.cached_float("beam_height")
+        width = self.cached_float("beam_width")
         
-        # Create sophisticated 3D beam geometry
-        x_beam = np.array([0, length, length, 0, 0])
-        y_beam = np.array([-width/2, -width/2, width/2, width/2, -width/2])
-        z_bottom = np.zeros(5)
-        z_top = np.ones(5) * height
+        # Create sophisticated 3D beam geometry, reused while the dimensions are unchanged
+        geometry = beam_geometry(length, width, height)
+        x_beam, y_beam = geometry['x_beam'], geometry['y_beam']
+        z_bottom, z_top = geometry['z_bottom'], geometry['z_top']
         
         # Draw beam with gradient coloring and material texture
         self.ax_3d.plot(x_beam, y_beam, z_bottom, 'b-', linewidth=3, alpha=0.8)
@@ -734,33 +736,25 @@ class Advanced3DBeamGUI(tb.Window):
                            [z_bottom[i], z_top[i]], 'b-', linewidth=2, alpha=0.6)
             
         # Create realistic beam surfaces with gradients
-        xx = np.linspace(0, length, 50)
-        yy = np.linspace(-width/2, width/2, 20)
-        XX, YY = np.meshgrid(xx, yy)
+        XX, YY = geometry['XX'], geometry['YY']
         
         # Top surface with metallic gradient
-        ZZ_top = np.ones_like(XX) * height
-        colors_top = plt.cm.plasma(np.linspace(0.3, 0.8, len(yy)))
-        for i in range(len(yy)-1):
-            self.ax_3d.plot_surface(XX[i:i+2], YY[i:i+2], ZZ_top[i:i+2], 
-                                   color=colors_top[i], alpha=0.7, shade=True)
+        self.ax_3d.plot_surface(XX, YY, geometry['ZZ_top'], rstride=1, cstride=1, linewidth=0,
+                               alpha=0.7, shade=True, facecolors=geometry['facecolors_top'])
         
         # Bottom surface
-        ZZ_bottom = np.zeros_like(XX)
-        colors_bottom = plt.cm.viridis(np.linspace(0.2, 0.7, len(yy)))
-        for i in range(len(yy)-1):
-            self.ax_3d.plot_surface(XX[i:i+2], YY[i:i+2], ZZ_bottom[i:i+2], 
-                                   color=colors_bottom[i], alpha=0.6, shade=True)
+        self.ax_3d.plot_surface(XX, YY, geometry['ZZ_bottom'], rstride=1, cstride=1, linewidth=0,
+                               alpha=0.6, shade=True, facecolors=geometry['facecolors_bottom'])
         
         # Add stunning support visualizations
-        self.render_advanced_supports()
+        self.render_advanced_supports(height, width)
         
         # Add impressive load visualizations
-        self.render_advanced_loads()
+        self.render_advanced_loads(height, width)
         
         # Add deflection curve if analysis is complete
         if hasattr(self.beam_engine, 'results') and self.beam_engine.results:
-            self.render_deflection_curve()
+            self.render_deflection_curve(height)
             
         # Enhanced axis styling with professional appearance
         self.ax_3d.set_xlabel('Length (m)', fontsize=12, color='white', fontweight='bold')
@@ -781,16 +775,14 @@ class Advanced3DBeamGUI(tb.Window):
         # Set viewing angle for optimal visualization
         self.ax_3d.view_init(elev=20, azim=45)
         
-        self.canvas.draw()
+        if draw:
+            self.canvas.draw_idle()
         
-    def render_advanced_supports(self):
+    def render_advanced_supports(self, height, width):
         """Render sophisticated 3D support representations"""
         if not self.beam_engine.supports:
             return
             
-        height = float(self.property_vars.get("beam_height", tk.StringVar(value="0.3")).get())
-        width = float(self.property_vars.get("beam_width", tk.StringVar(value="0.2")).get())
-        
         for support in self.beam_engine.supports:
             x_pos = support.position
             
@@ -815,18 +807,20 @@ class Advanced3DBeamGUI(tb.Window):
                 cylinder_radius = width * 0.15
                 cylinder_height = height * 0.3
                 
-                # Create multiple rollers for realistic effect
-                for i, offset in enumerate([-width*0.3, 0, width*0.3]):
-                    theta = np.linspace(0, 2*np.pi, 20)
-                    z_cyl = np.linspace(-cylinder_height, 0, 10)
-                    
-                    for z in z_cyl[::2]:  # Sample points for performance
-                        x_circle = x_pos + np.zeros_like(theta)
-                        y_circle = offset + cylinder_radius * np.cos(theta)
-                        z_circle = z + cylinder_radius * np.sin(theta)
-                        
-                        self.ax_3d.plot(x_circle, y_circle, z_circle, 
-                                      color=plt.cm.rainbow(i/2), linewidth=2, alpha=0.7)
+                # Create multiple rollers for realistic effect, every ring of
+                # every roller drawn as one collection
+                offsets = np.array([-width*0.3, 0, width*0.3])
+                theta = np.linspace(0, 2*np.pi, 20)
+                z_cyl = np.linspace(-cylinder_height, 0, 10)[::2]  # Sample points for performance
+                
+                OFF, Z = np.meshgrid(offsets, z_cyl, indexing='ij')
+                rings = np.empty(OFF.shape + theta.shape + (3,))
+                rings[..., 0] = x_pos
+                rings[..., 1] = OFF[..., None] + cylinder_radius * np.cos(theta)
+                rings[..., 2] = Z[..., None] + cylinder_radius * np.sin(theta)
+                
+                self.ax_3d.add_collection3d(Line3DCollection(
+                    rings.reshape(-1, len(theta), 3), colors=ROLLER_RING_COLORS, linewidths=2, alpha=0.7))
                         
             elif support.type.lower() == "fixed":
                 # Enhanced fixed support with 3D rectangular base
@@ -845,26 +839,24 @@ class Advanced3DBeamGUI(tb.Window):
                 self.ax_3d.plot(x_base, y_base, z_base_top, 'k-', linewidth=5, alpha=0.9)
                 
                 # Connect with vertical lines
-                for i in range(len(x_base)):
-                    self.ax_3d.plot([x_base[i], x_base[i]], [y_base[i], y_base[i]], 
-                                   [z_base_bottom[i], z_base_top[i]], 'k-', linewidth=3, alpha=0.8)
+                corners = np.column_stack([x_base, y_base])
+                verticals = np.stack([np.column_stack([corners, z_base_bottom]),
+                                      np.column_stack([corners, z_base_top])], axis=1)
+                self.ax_3d.add_collection3d(Line3DCollection(
+                    verticals, colors='k', linewidths=3, alpha=0.8, capstyle='projecting'))
                     
-                # Add hatching pattern for fixed support
-                for i in range(5):
-                    y_hatch = np.linspace(-base_width/2, base_width/2, 10)
-                    z_hatch = np.linspace(-base_height, 0, 10)
-                    x_hatch = x_pos + np.zeros_like(y_hatch)
-                    self.ax_3d.plot(x_hatch, y_hatch[::2], z_hatch[::2], 
-                                   'k-', linewidth=1, alpha=0.6)
+                # Add hatching pattern for fixed support (a single diagonal;
+                # the old loop drew the same line five times)
+                y_hatch = np.linspace(-base_width/2, base_width/2, 5)
+                z_hatch = np.linspace(-base_height, 0, 5)
+                x_hatch = x_pos + np.zeros_like(y_hatch)
+                self.ax_3d.plot(x_hatch, y_hatch, z_hatch, 'k-', linewidth=1, alpha=0.6)
                     
-    def render_advanced_loads(self):
+    def render_advanced_loads(self, height, width):
         """Render spectacular 3D load representations"""
         if not (self.beam_engine.concentrated_loads or self.beam_engine.varying_loads):
             return
             
-        height = float(self.property_vars.get("beam_height", tk.StringVar(value="0.3")).get())
-        width = float(self.property_vars.get("beam_width", tk.StringVar(value="0.2")).get())
-        
         # Render concentrated loads with dynamic arrows
         for load in self.beam_engine.concentrated_loads:
             x_pos = load.position
@@ -874,26 +866,29 @@ class Advanced3DBeamGUI(tb.Window):
             arrow_length = magnitude * 0.5
             arrow_start_z = height + arrow_length
             
-            # Arrow shaft with color gradient
-            arrow_colors = plt.cm.plasma(np.linspace(0, 1, 10))
+            # Arrow shaft with color gradient, one tapering segment per color
             z_arrow = np.linspace(arrow_start_z, height, 10)
             
-            for i, (z, color) in enumerate(zip(z_arrow[:-1], arrow_colors)):
-                self.ax_3d.plot([x_pos, x_pos], [0, 0], [z, z_arrow[i+1]], 
-                               color=color, linewidth=6-i*0.3, alpha=0.8)
+            shaft = np.zeros((9, 2, 3))
+            shaft[..., 0] = x_pos
+            shaft[:, 0, 2] = z_arrow[:-1]
+            shaft[:, 1, 2] = z_arrow[1:]
+            self.ax_3d.add_collection3d(Line3DCollection(
+                shaft, colors=ARROW_SHAFT_COLORS, linewidths=6 - np.arange(9)*0.3, alpha=0.8,
+                capstyle='projecting'))
                 
             # Enhanced arrowhead with 3D cone effect
             cone_height = arrow_length * 0.3
             cone_radius = width * 0.1
             
-            theta = np.linspace(0, 2*np.pi, 12)
-            for i, angle in enumerate(theta):
-                x_cone = x_pos + cone_radius * np.cos(angle) * np.linspace(1, 0, 5)
-                y_cone = 0 + cone_radius * np.sin(angle) * np.linspace(1, 0, 5)
-                z_cone = np.linspace(height + cone_height, height, 5)
-                
-                self.ax_3d.plot(x_cone, y_cone, z_cone, 
-                               color=plt.cm.plasma(0.8), linewidth=2, alpha=0.9)
+            theta = np.linspace(0, 2*np.pi, 12)[:, None]
+            taper = np.linspace(1, 0, 5)
+            cone = np.empty((12, 5, 3))
+            cone[..., 0] = x_pos + cone_radius * np.cos(theta) * taper
+            cone[..., 1] = 0 + cone_radius * np.sin(theta) * taper
+            cone[..., 2] = np.linspace(height + cone_height, height, 5)
+            self.ax_3d.add_collection3d(Line3DCollection(
+                cone, colors=ARROW_TIP_COLOR, linewidths=2, alpha=0.9, capstyle='projecting'))
                 
             # Add load magnitude label with 3D effect
             self.ax_3d.text(x_pos, width*0.8, arrow_start_z + 0.1,
@@ -912,20 +907,20 @@ class Advanced3DBeamGUI(tb.Window):
             magnitudes = np.linspace(mag_start, mag_end, 20)
             
             # Draw varying load distribution with color mapping
-            for i, (x, mag) in enumerate(zip(x_dist, magnitudes)):
-                arrow_length = mag * 0.3
-                color_intensity = mag / max(magnitudes) if max(magnitudes) > 0 else 0
-                color = plt.cm.viridis(color_intensity)
-                
-                # Varying arrow lengths
-                self.ax_3d.plot([x, x], [0, 0], 
-                               [height + arrow_length, height],
-                               color=color, linewidth=4, alpha=0.8)
-                
-                # Small arrowheads
-                if i % 3 == 0:  # Every third arrow gets an arrowhead
-                    self.ax_3d.scatter([x], [0], [height], 
-                                     c=[color], s=50, alpha=0.9, marker='v')
+            max_mag = magnitudes.max()
+            colors = plt.cm.viridis(magnitudes / max_mag if max_mag > 0 else np.zeros(20))
+            
+            # Varying arrow lengths
+            arrows = np.zeros((20, 2, 3))
+            arrows[..., 0] = x_dist[:, None]
+            arrows[:, 0, 2] = height + magnitudes * 0.3
+            arrows[:, 1, 2] = height
+            self.ax_3d.add_collection3d(Line3DCollection(
+                arrows, colors=colors, linewidths=4, alpha=0.8, capstyle='projecting'))
+            
+            # Small arrowheads, every third arrow gets one
+            self.ax_3d.scatter(x_dist[::3], np.zeros(7), np.full(7, height),
+                               c=colors[::3], s=50, alpha=0.9, marker='v', depthshade=False)
                     
             # Connect the tops with a smooth curve
             z_tops = height + magnitudes * 0.3
@@ -940,7 +935,7 @@ class Advanced3DBeamGUI(tb.Window):
                            fontsize=9, color='orange', fontweight='bold',
                            bbox=dict(boxstyle="round,pad=0.3", facecolor='black', alpha=0.7))
                            
-    def render_deflection_curve(self):
+    def render_deflection_curve(self, height):
         """Render stunning deflection curve with enhanced 3D visualization"""
         if not self.beam_engine.results:
             return
@@ -949,58 +944,55 @@ class Advanced3DBeamGUI(tb.Window):
         deflection = self.beam_engine.results['deflection']
         
         # Scale deflection for visibility
-        max_deflection = np.max(np.abs(deflection))
+        max_deflection = self.beam_engine.results['max_deflection']
         if max_deflection > 0:
             scale_factor = 0.5 / max_deflection
             scaled_deflection = deflection * scale_factor
         else:
             scaled_deflection = deflection
             
-        height = float(self.property_vars.get("beam_height", tk.StringVar(value="0.3")).get())
         
         # Create deflection curve with rainbow gradient
         deflection_colors = plt.cm.rainbow(np.linspace(0, 1, len(x)))
         
-        # Plot deflection curve as a 3D line with varying colors
-        for i in range(len(x)-1):
-            self.ax_3d.plot(x[i:i+2], [0,0], height + scaled_deflection[i:i+2],
-                           color=deflection_colors[i], linewidth=3, alpha=0.9)
+        # Plot deflection curve as one collection of segments with varying colors
+        points = np.column_stack([x, np.zeros_like(x), height + scaled_deflection])
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        self.ax_3d.add_collection3d(Line3DCollection(
+            segments, colors=deflection_colors[:-1], linewidths=3, alpha=0.9, capstyle='projecting'))
             
-        # Add deflection magnitude indicators
-        critical_points = np.where(np.abs(scaled_deflection) > 0.1 * np.max(np.abs(scaled_deflection)))[0]
+        # Add deflection magnitude indicators (scaling is positive, so the
+        # threshold can be taken on the raw deflection and its known peak)
+        critical_points = np.flatnonzero(np.abs(deflection) > 0.1 * max_deflection)
         if len(critical_points) > 0:
             step = max(1, len(critical_points) // 5)
-            for idx in critical_points[::step]:
-                self.ax_3d.scatter([x[idx]], [0], [height + scaled_deflection[idx]], 
-                                 c='red', s=100, alpha=0.8, edgecolors='white', linewidth=2)
+            marked = critical_points[::step]
+            self.ax_3d.scatter(x[marked], np.zeros(len(marked)), height + scaled_deflection[marked],
+                               c='red', s=100, alpha=0.8, edgecolors='white', linewidth=2,
+                               depthshade=False)
             
         # Add deflection curve legend
-        max_def_idx = np.argmax(np.abs(scaled_deflection))
+        max_def_idx = self.beam_engine.results['max_deflection_idx']
         self.ax_3d.text(x[max_def_idx], 0.3, height + scaled_deflection[max_def_idx],
                        f'Max Δ: {max_deflection*1000:.2f} mm',
                        fontsize=10, color='red', fontweight='bold',
                        bbox=dict(boxstyle="round,pad=0.3", facecolor='yellow', alpha=0.8))
                        
-    def update_analysis_plots(self):
-        """Update 2D analysis plots with professional styling"""
-        if not self.beam_engine or not hasattr(self.beam_engine, 'results'):
-            return
-
-        results = self.beam_engine.results
-        x = results['x']
-        shear = results['shear'] / 1000  # Convert to kN
-        moment = results['moment'] / 1000  # Convert to kN·m
-
-        # --- Plot Styling Function ---
-        def style_plot(ax, data, color, title, ylabel, xlabel=None):
+    def create_diagram_artists(self):
+        """Style the 2D analysis axes and create their persistent line and fill artists"""
+        self.diagram_artists = {}
+        
+        for ax, color, title, ylabel, xlabel in [
+                (self.ax_shear, '#e74c3c', 'Shear Force Diagram', 'Shear Force (kN)', None),
+                (self.ax_moment, '#3498db', 'Bending Moment Diagram', 'Moment (kN·m)', 'Position (m)')]:
             ax.clear()
             ax.axhline(y=0, color='white', linestyle='--', alpha=0.6, linewidth=1)
 
             # Plot shadow for depth
-            ax.plot(x, data, linewidth=4, color='black', alpha=0.2)
+            shadow, = ax.plot([], [], linewidth=4, color='black', alpha=0.2)
             # Main plot line
-            ax.plot(x, data, linewidth=2.5, color=color, label=title)
-            ax.fill_between(x, 0, data, alpha=0.2, color=color)
+            line, = ax.plot([], [], linewidth=2.5, color=color, label=title)
+            fill = ax.fill_between([], 0, [], alpha=0.2, color=color)
 
             ax.set_title(title, color='white', fontweight='bold', fontsize=14, pad=15)
             ax.set_ylabel(ylabel, color='#bdc3c7', fontweight='bold', fontsize=11)
@@ -1019,12 +1011,52 @@ class Advanced3DBeamGUI(tb.Window):
             for text in legend.get_texts():
                 text.set_color('white')
 
-        # --- Annotation Styling Function ---
-        def add_max_annotation(ax, data, x_coords, unit):
+            # Max value annotation, moved into place on each update
+            annotation = ax.annotate('', xy=(0, 0),
+                        xytext=(15, 15), textcoords='offset points',
+                        ha='left',
+                        bbox=dict(boxstyle='round,pad=0.4', fc='#34495e', ec='#bdc3c7', alpha=0.9),
+                        color='#ecf0f1', fontweight='bold', fontsize=9,
+                        arrowprops=dict(arrowstyle='-|>', color='#ecf0f1', lw=1.5,
+                                        connectionstyle="arc3,rad=0.1"))
+            annotation.set_visible(False)
+                
+            self.diagram_artists[ax] = (shadow, line, fill, annotation)
+        
+    def update_analysis_plots(self, draw=True):
+        """Update 2D analysis plots with professional styling"""
+        if not self.beam_engine or not hasattr(self.beam_engine, 'results'):
+            return
+
+        results = self.beam_engine.results
+        x = results['x']
+        shear = results['shear'] / 1000  # Convert to kN
+        moment = results['moment'] / 1000  # Convert to kN·m
+        
+        # The axes are styled once; later updates only swap the data
+        layout_needed = self.diagram_artists is None
+        if layout_needed:
+            self.create_diagram_artists()
+
+        # --- Data Update Function ---
+        def update_plot(ax, data):
+            shadow, line, fill, _ = self.diagram_artists[ax]
+            shadow.set_data(x, data)
+            line.set_data(x, data)
+            # Closed polygon between the curve and zero; set_verts works on every
+            # matplotlib version, unlike fill_between's set_data (3.10+)
+            fill.set_verts([np.column_stack([np.concatenate([x, x[::-1]]),
+                                             np.concatenate([data, np.zeros_like(data)])])])
+            ax.relim()
+            ax.autoscale_view()
+
+        # --- Annotation Update Function ---
+        def update_max_annotation(ax, data, x_coords, unit, max_idx):
+            annotation = self.diagram_artists[ax][3]
             if len(data) == 0:
+                annotation.set_visible(False)
                 return
-            max_val = data[np.argmax(np.abs(data))]
-            max_idx = np.argmax(np.abs(data))
+            max_val = data[max_idx]
             x_pos = x_coords[max_idx]
             
             # Dynamic positioning of annotation
@@ -1032,25 +1064,23 @@ class Advanced3DBeamGUI(tb.Window):
             x_offset = 15
             y_offset = 15 if y_pos >= 0 else -30
 
-            ax.annotate(f'Max Abs: {abs(max_val):.2f} {unit}',
-                        xy=(x_pos, y_pos),
-                        xytext=(x_offset, y_offset), textcoords='offset points',
-                        ha='left',
-                        bbox=dict(boxstyle='round,pad=0.4', fc='#34495e', ec='#bdc3c7', alpha=0.9),
-                        color='#ecf0f1', fontweight='bold', fontsize=9,
-                        arrowprops=dict(arrowstyle='-|>', color='#ecf0f1', lw=1.5,
-                                        connectionstyle="arc3,rad=0.1"))
-
-        # --- Apply styles to plots ---
-        style_plot(self.ax_shear, shear, '#e74c3c', 'Shear Force Diagram', 'Shear Force (kN)')
-        style_plot(self.ax_moment, moment, '#3498db', 'Bending Moment Diagram', 'Moment (kN·m)', 'Position (m)')
+            annotation.xy = (x_pos, y_pos)
+            annotation.xyann = (x_offset, y_offset)
+            annotation.set_text(f'Max Abs: {abs(max_val):.2f} {unit}')
+            annotation.set_visible(True)
 
-        # --- Add annotations ---
-        add_max_annotation(self.ax_shear, shear, x, 'kN')
-        add_max_annotation(self.ax_moment, moment, x, 'kN·m')
+        # --- Update plot data ---
+        update_plot(self.ax_shear, shear)
+        update_plot(self.ax_moment, moment)
+        update_max_annotation(self.ax_shear, shear, x, 'kN', results['max_shear_idx'])
+        update_max_annotation(self.ax_moment, moment, x, 'kN·m', results['max_moment_idx'])
 
-        plt.tight_layout(pad=3.0)
-        self.canvas.draw()
+        # Lay the figure out once with the first data set; rerunning the
+        # solver on every analysis cost more than the plot update itself
+        if layout_needed:
+            self.fig.tight_layout(pad=3.0)
+        if draw:
+            self.canvas.draw_idle()
         
     def update_results_display(self):
         """Update results display with comprehensive analysis data"""
@@ -1060,190 +1090,65 @@ class Advanced3DBeamGUI(tb.Window):
         results = self.beam_engine.results
         
         # Update summary tab with enhanced formatting
-        summary = f"""
-╔══════════════════════════════════════╗
-║          BEAM ANALYSIS SUMMARY        ║
-╠══════════════════════════════════════╣
-║ Beam Length: {self.beam_engine.beam_props.length:.2f} m              ║
-║ Material: {self.material_combo.get()}                     ║
-║ E: {self.beam_engine.beam_props.elastic_modulus/1e9:.1f} GPa                      ║
-║ I: {self.beam_engine.beam_props.moment_of_inertia:.2e} m⁴       ║
-╠══════════════════════════════════════╣
-║            CRITICAL VALUES            ║
-╠══════════════════════════════════════╣
-║ Max Moment: {results['max_moment']/1000:.2f} kN⋅m          ║
-║ Max Shear: {np.max(np.abs(results['shear']))/1000:.2f} kN             ║
-║ Max Deflection: {results['max_deflection']*1000:.3f} mm      ║
-║ Max Stress: {results['max_stress']/1e6:.2f} MPa            ║
-╠══════════════════════════════════════╣
-║              SUPPORTS                 ║
-╠══════════════════════════════════════╣"""
+        beam_props = self.beam_engine.beam_props
+        parts = [SUMMARY_TEMPLATE.format_map({
+            'length': beam_props.length,
+            'material': self.material_combo.get(),
+            'E_GPa': beam_props.elastic_modulus/1e9,
+            'I': beam_props.moment_of_inertia,
+            'max_moment_kNm': results['max_moment']/1000,
+            'max_shear_kN': results['max_shear']/1000,
+            'max_deflection_mm': results['max_deflection']*1000,
+            'max_stress_MPa': results['max_stress']/1e6,
+        })]
 
         for i, support in enumerate(self.beam_engine.supports):
-            summary += f"║ Support {i+1}: {support.type.title()} @ {support.position:.2f}m      ║\n"
+            parts.append(f"║ Support {i+1}: {support.type.title()} @ {support.position:.2f}m      ║\n")
             
-        summary += f"""╠══════════════════════════════════════╣
+        parts.append("""╠══════════════════════════════════════╣
 ║               LOADS                   ║
-╠══════════════════════════════════════╣"""
+╠══════════════════════════════════════╣""")
 
         for i, load in enumerate(self.beam_engine.concentrated_loads):
-            summary += f"║ Load {i+1}: {load.magnitude/1000:.1f} kN @ {load.position:.2f}m    ║\n"
+            parts.append(f"║ Load {i+1}: {load.magnitude/1000:.1f} kN @ {load.position:.2f}m    ║\n")
             
         for i, load in enumerate(self.beam_engine.varying_loads):
-            summary += f"║ Vary Load {i+1}: {load.start_magnitude/1000:.1f}-{load.end_magnitude/1000:.1f} kN/m  ║\n"
+            parts.append(f"║ Vary Load {i+1}: {load.start_magnitude/1000:.1f}-{load.end_magnitude/1000:.1f} kN/m  ║\n")
             
-        summary += "╚══════════════════════════════════════╝"
+        parts.append("╚══════════════════════════════════════╝")
+        summary = "".join(parts)
         
         self.summary_text.config(state="normal")
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(tk.END, summary)
+        self.summary_text.replace(1.0, tk.END, summary)
         self.summary_text.config(state="disabled")
         
         # Update detailed results
-        detailed = f"""
+        parts = [f"""
 DETAILED ANALYSIS RESULTS
 {'='*50}
 
 REACTION FORCES:
 {'-'*20}
-"""
-        for i, (support, reaction) in enumerate(zip(self.beam_engine.supports, results['reactions'])):
-            detailed += f"R{i+1} ({support.type} @ {support.position:.2f}m): {reaction/1000:.2f} kN\n"
-            
-        detailed += f"""
-DEFLECTION ANALYSIS:
-{'-'*20}
-Maximum Deflection: {results['max_deflection']*1000:.3f} mm
-Location of Max Deflection: {results['x'][np.argmax(np.abs(results['deflection']))]:.2f} m
-Deflection Limit (L/250): {self.beam_engine.beam_props.length*1000/250:.3f} mm
-
-STRESS ANALYSIS:
-{'-'*20}
-Maximum Stress: {results['max_stress']/1e6:.2f} MPa
-Allowable Stress (Steel): 250 MPa
-Safety Factor: {250/(results['max_stress']/1e6):.2f}
-
-MOMENT ANALYSIS:
-{'-'*20}
-Maximum Positive Moment: {np.max(results['moment'])/1000:.2f} kN⋅m
-Maximum Negative Moment: {np.min(results['moment'])/1000:.2f} kN⋅m
-Location of Max Moment: {results['x'][np.argmax(np.abs(results['moment']))]:.2f} m
-
-SHEAR ANALYSIS:
-{'-'*20}
-Maximum Shear: {np.max(np.abs(results['shear']))/1000:.2f} kN
-Critical Shear Locations: Multiple points analyzed
-"""
-        
-        self.detailed_text.config(state="normal")
-        self.detailed_text.delete(1.0, tk.END)
-        self.detailed_text.insert(tk.END, detailed)
-        self.detailed_text.config(state="disabled")
-        
-        # Update safety assessment
-        self.update_safety_assessment(results)
-        
-    def update_safety_assessment(self, results):
-        """Comprehensive safety assessment with color-coded warnings"""
-        max_stress = results['max_stress'] / 1e6  # MPa
-        max_deflection = results['max_deflection'] * 1000  # mm
-        deflection_limit = self.beam_engine.beam_props.length * 1000 / 250  # mm
-        
-        safety = f"""
-COMPREHENSIVE SAFETY ASSESSMENT
-{'='*50}
-
-STRUCTURAL INTEGRITY CHECK:
-{'-'*30}
-
-"""
-        
-        # Stress safety check
-        if max_stress < 150:
-            safety += "✅ STRESS: EXCELLENT - Well within safe limits\n"
-        elif max_stress < 200:
-            safety += "⚠️  STRESS: GOOD - Acceptable stress levels\n"
-        elif max_stress < 250:
-            safety += "🔶 STRESS: CAUTION - Approaching design limits\n"
-        else:
-            safety += "❌ STRESS: CRITICAL - Exceeds safe limits!\n"
-            
-        safety += f"   Current: {max_stress:.2f} MPa | Limit: 250 MPa\n\n"
-        
-        # Deflection safety check
-        if max_deflection < deflection_limit * 0.5:
-            safety += "✅ DEFLECTION: EXCELLENT - Minimal deflection\n"
-        elif max_deflection < deflection_limit * 0.8:
-            safety += "⚠️  DEFLECTION: GOOD - Acceptable deflection\n"
-        elif max_deflection < deflection_limit:
-            safety += "🔶 DEFLECTION: CAUTION - Approaching limits\n"
-        else:
-            safety += "❌ DEFLECTION: CRITICAL - Exceeds limits!\n"
-            
-        safety += f"   Current: {max_deflection:.3f} mm | Limit: {deflection_limit:.3f} mm\n\n"
-        
-        # Overall safety rating
-        stress_factor = 250 / max_stress if max_stress > 0 else float('inf')
-        deflection_factor = deflection_limit / max_deflection if max_deflection > 0 else float('inf')
-        overall_factor = min(stress_factor, deflection_factor)
-        
-        safety += f"""
-OVERALL SAFETY FACTORS:
-{'-'*25}
-Stress Safety Factor: {stress_factor:.2f}
-Deflection Safety Factor: {deflection_factor:.2f}
-Critical Safety Factor: {overall_factor:.2f}
-
-RECOMMENDATIONS:
-{'-'*15}
-"""
-        
-        if overall_factor > 3:
-            safety += "✅ Structure is over-designed. Consider optimization.\n"
-        elif overall_factor > 2:
-            safety += "✅ Excellent safety margin. Design is robust.\n"
-        elif overall_factor > 1.5:
-            safety += "⚠️  Adequate safety. Monitor under service loads.\n"
-        elif overall_factor > 1:
-            safety += "🔶 Minimal safety margin. Consider reinforcement.\n"
-        else:
-            safety += "❌ UNSAFE DESIGN! Immediate redesign required!\n"
-            
-        self.safety_text.config(state="normal")
-        self.safety_text.delete(1.0, tk.END)
-        self.safety_text.insert(tk.END, safety)
-        self.safety_text.config(state="disabled")
+"""]
         for i, (support, reaction) in enumerate(zip(self.beam_engine.supports, results['reactions'])):
-            detailed += f"R{i+1} ({support.type} @ {support.position:.2f}m): {reaction/1000:.2f} kN\n"
+            parts.append(f"R{i+1} ({support.type} @ {support.position:.2f}m): {reaction/1000:.2f} kN\n")
             
-        detailed += f"""
-DEFLECTION ANALYSIS:
-{'-'*20}
-Maximum Deflection: {results['max_deflection']*1000:.3f} mm
-Location of Max Deflection: {results['x'][np.argmax(np.abs(results['deflection']))]:.2f} m
-Deflection Limit (L/250): {self.beam_engine.beam_props.length*1000/250:.3f} mm
-
-STRESS ANALYSIS:
-{'-'*20}
-Maximum Stress: {results['max_stress']/1e6:.2f} MPa
-Allowable Stress (Steel): 250 MPa
-Safety Factor: {250/(results['max_stress']/1e6):.2f}
-
-MOMENT ANALYSIS:
-{'-'*20}
-Maximum Positive Moment: {np.max(results['moment'])/1000:.2f} kN⋅m
-Maximum Negative Moment: {np.min(results['moment'])/1000:.2f} kN⋅m
-Location of Max Moment: {results['x'][np.argmax(np.abs(results['moment']))]:.2f} m
-
-SHEAR ANALYSIS:
-{'-'*20}
-Maximum Shear: {np.max(np.abs(results['shear']))/1000:.2f} kN
-Critical Shear Locations: Multiple points analyzed
-"""
+        x = results['x']
+        parts.append(DETAILED_TEMPLATE.format_map({
+            'max_deflection_mm': results['max_deflection']*1000,
+            'max_deflection_x': x[results['max_deflection_idx']],
+            'deflection_limit_mm': beam_props.length*1000/250,
+            'max_stress_MPa': results['max_stress']/1e6,
+            'safety_factor': 250/(results['max_stress']/1e6) if results['max_stress'] > 0 else float('inf'),
+            'max_positive_moment_kNm': np.max(results['moment'])/1000,
+            'max_negative_moment_kNm': np.min(results['moment'])/1000,
+            'max_moment_x': x[results['max_moment_idx']],
+            'max_shear_kN': results['max_shear']/1000,
+        }))
+        detailed = "".join(parts)
         
         self.detailed_text.config(state="normal")
-        self.detailed_text.delete(1.0, tk.END)
-        self.detailed_text.insert(tk.END, detailed)
+        self.detailed_text.replace(1.0, tk.END, detailed)
         self.detailed_text.config(state="disabled")
         
         # Update safety assessment
@@ -1255,45 +1160,45 @@ Critical Shear Locations: Multiple points analyzed
         max_deflection = results['max_deflection'] * 1000  # mm
         deflection_limit = self.beam_engine.beam_props.length * 1000 / 250  # mm
         
-        safety = f"""
+        parts = [f"""
 COMPREHENSIVE SAFETY ASSESSMENT
 {'='*50}
 
 STRUCTURAL INTEGRITY CHECK:
 {'-'*30}
 
-"""
+"""]
         
         # Stress safety check
         if max_stress < 150:
-            safety += "✅ STRESS: EXCELLENT - Well within safe limits\n"
+            parts.append("✅ STRESS: EXCELLENT - Well within safe limits\n")
         elif max_stress < 200:
-            safety += "⚠️  STRESS: GOOD - Acceptable stress levels\n"
+            parts.append("⚠️  STRESS: GOOD - Acceptable stress levels\n")
         elif max_stress < 250:
-            safety += "🔶 STRESS: CAUTION - Approaching design limits\n"
+            parts.append("🔶 STRESS: CAUTION - Approaching design limits\n")
         else:
-            safety += "❌ STRESS: CRITICAL - Exceeds safe limits!\n"
+            parts.append("❌ STRESS: CRITICAL - Exceeds safe limits!\n")
             
-        safety += f"   Current: {max_stress:.2f} MPa | Limit: 250 MPa\n\n"
+        parts.append(f"   Current: {max_stress:.2f} MPa | Limit: 250 MPa\n\n")
         
         # Deflection safety check
         if max_deflection < deflection_limit * 0.5:
-            safety += "✅ DEFLECTION: EXCELLENT - Minimal deflection\n"
+            parts.append("✅ DEFLECTION: EXCELLENT - Minimal deflection\n")
         elif max_deflection < deflection_limit * 0.8:
-            safety += "⚠️  DEFLECTION: GOOD - Acceptable deflection\n"
+            parts.append("⚠️  DEFLECTION: GOOD - Acceptable deflection\n")
         elif max_deflection < deflection_limit:
-            safety += "🔶 DEFLECTION: CAUTION - Approaching limits\n"
+            parts.append("🔶 DEFLECTION: CAUTION - Approaching limits\n")
         else:
-            safety += "❌ DEFLECTION: CRITICAL - Exceeds limits!\n"
+            parts.append("❌ DEFLECTION: CRITICAL - Exceeds limits!\n")
             
-        safety += f"   Current: {max_deflection:.3f} mm | Limit: {deflection_limit:.3f} mm\n\n"
+        parts.append(f"   Current: {max_deflection:.3f} mm | Limit: {deflection_limit:.3f} mm\n\n")
         
         # Overall safety rating
         stress_factor = 250 / max_stress if max_stress > 0 else float('inf')
         deflection_factor = deflection_limit / max_deflection if max_deflection > 0 else float('inf')
         overall_factor = min(stress_factor, deflection_factor)
         
-        safety += f"""
+        parts.append(f"""
 OVERALL SAFETY FACTORS:
 {'-'*25}
 Stress Safety Factor: {stress_factor:.2f}
@@ -1302,22 +1207,22 @@ Critical Safety Factor: {overall_factor:.2f}
 
 RECOMMENDATIONS:
 {'-'*15}
-"""
+""")
         
         if overall_factor > 3:
-            safety += "✅ Structure is over-designed. Consider optimization.\n"
+            parts.append("✅ Structure is over-designed. Consider optimization.\n")
         elif overall_factor > 2:
-            safety += "✅ Excellent safety margin. Design is robust.\n"
+            parts.append("✅ Excellent safety margin. Design is robust.\n")
         elif overall_factor > 1.5:
-            safety += "⚠️  Adequate safety. Monitor under service loads.\n"
+            parts.append("⚠️  Adequate safety. Monitor under service loads.\n")
         elif overall_factor > 1:
-            safety += "🔶 Minimal safety margin. Consider reinforcement.\n"
+            parts.append("🔶 Minimal safety margin. Consider reinforcement.\n")
         else:
-            safety += "❌ UNSAFE DESIGN! Immediate redesign required!\n"
+            parts.append("❌ UNSAFE DESIGN! Immediate redesign required!\n")
             
+        safety = "".join(parts)
         self.safety_text.config(state="normal")
-        self.safety_text.delete(1.0, tk.END)
-        self.safety_text.insert(tk.END, safety)
+        self.safety_text.replace(1.0, tk.END, safety)
         self.safety_text.config(state="disabled")
         
     def animate_results(self):
@@ -1368,68 +1273,93 @@ RECOMMENDATIONS:
         deflection = results['deflection']
         
         # Scale deflection for visibility
-        max_deflection = np.max(np.abs(deflection))
+        max_deflection = results['max_deflection']
         if max_deflection > 0:
             scale_factor = 2.0 / max_deflection
             scaled_deflection = deflection * scale_factor
         else:
             scaled_deflection = deflection
             
-        # Animation function
+        # Build the scene once; frames only move the deflected artists
+        # Draw original beam
+        anim_ax.plot(x, np.zeros_like(x), 'b-', linewidth=8, alpha=0.3, label='Original Position')
+        
+        # Deflected beam with rainbow colors, one segment per sample interval
+        segments = np.zeros((len(x) - 1, 2, 2))
+        segments[:, 0, 0] = x[:-1]
+        segments[:, 1, 0] = x[1:]
+        colors = plt.cm.rainbow(np.linspace(0, 1, len(x)))
+        deflected = LineCollection(segments, colors=colors[:-1], linewidths=4, alpha=0.8,
+                                   capstyle='projecting', zorder=2)
+        anim_ax.add_collection(deflected, autolim=False)
+        
+        # Add supports
+        for support in self.beam_engine.supports:
+            if support.type.lower() == "pin":
+                anim_ax.plot(support.position, 0, 'r^', markersize=15, markeredgecolor='yellow')
+            elif support.type.lower() == "roller":
+                anim_ax.plot(support.position, 0, 'ro', markersize=12, markeredgecolor='yellow')
+            elif support.type.lower() == "fixed":
+                anim_ax.plot(support.position, 0, 'ks', markersize=15, markeredgecolor='yellow')
+                
+        # Add loads, remembering the sample each one rides on
+        load_artists = []
+        for load in self.beam_engine.concentrated_loads:
+            arrow = anim_ax.annotate('', xy=(load.position, 0), xytext=(load.position, 0),
+                                     arrowprops=dict(arrowstyle='->', lw=3, color='red'))
+            label = anim_ax.text(load.position, 0, f'{load.magnitude/1000:.1f} kN',
+                                 ha='center', color='red', fontweight='bold')
+            load_artists.append((np.argmin(np.abs(x - load.position)), load.position, arrow, label))
+            
+        # Styling
+        anim_ax.set_xlim(0, self.beam_engine.beam_props.length)
+        anim_ax.set_ylim(-3, 3)
+        anim_ax.set_xlabel('Position (m)', color='white', fontweight='bold')
+        anim_ax.set_ylabel('Deflection (scaled)', color='white', fontweight='bold')
+        anim_ax.set_title('🎬 Animated Beam Deflection', color='white', fontweight='bold', fontsize=14)
+        # Blitting only repaints inside the axes, so the frame counter lives there
+        frame_label = anim_ax.text(0.02, 0.95, '', transform=anim_ax.transAxes,
+                                   color='white', fontweight='bold')
+        anim_ax.grid(True, alpha=0.3, color='cyan')
+        anim_ax.tick_params(colors='white')
+        anim_ax.legend(facecolor='black', edgecolor='white')
+        
+        moving_artists = [deflected, frame_label]
+        for _, _, arrow, label in load_artists:
+            moving_artists += [arrow, label]
+            
+        # Animation function; returns the artists it moved so only they are
+        # redrawn over the cached background of beam, supports and grid
         def animate_frame(frame):
             if not self.animation_running:
-                return []
+                # Freeze on the last frame: redraw the artists where they are, so the
+                # restored background is covered again, and stop the timer
+                anim_window.anim.event_source.stop()
+                return moving_artists
                 
-            anim_ax.clear()
-            
             # Animate deflection with wave effect
             time_factor = frame * 0.1 * speed_var.get()
-            wave_deflection = scaled_deflection * np.sin(time_factor)
+            wave_deflection = scaled_deflection * math.sin(time_factor)
             
-            # Draw original beam
-            anim_ax.plot(x, np.zeros_like(x), 'b-', linewidth=8, alpha=0.3, label='Original Position')
+            segments[:, 0, 1] = wave_deflection[:-1]
+            segments[:, 1, 1] = wave_deflection[1:]
+            deflected.set_segments(segments)
             
-            # Draw deflected beam with rainbow colors
-            colors = plt.cm.rainbow(np.linspace(0, 1, len(x)))
-            for i in range(len(x)-1):
-                anim_ax.plot(x[i:i+2], wave_deflection[i:i+2], 
-                           color=colors[i], linewidth=4, alpha=0.8)
-                           
-            # Add supports
-            for support in self.beam_engine.supports:
-                if support.type.lower() == "pin":
-                    anim_ax.plot(support.position, 0, 'r^', markersize=15, markeredgecolor='yellow')
-                elif support.type.lower() == "roller":
-                    anim_ax.plot(support.position, 0, 'ro', markersize=12, markeredgecolor='yellow')
-                elif support.type.lower() == "fixed":
-                    anim_ax.plot(support.position, 0, 'ks', markersize=15, markeredgecolor='yellow')
-                    
-            # Add loads
-            for load in self.beam_engine.concentrated_loads:
-                arrow_y = wave_deflection[np.argmin(np.abs(x - load.position))] + 0.5
-                anim_ax.annotate('', xy=(load.position, arrow_y-0.3), 
-                               xytext=(load.position, arrow_y),
-                               arrowprops=dict(arrowstyle='->', lw=3, color='red'))
-                anim_ax.text(load.position, arrow_y+0.1, f'{load.magnitude/1000:.1f} kN',
-                           ha='center', color='red', fontweight='bold')
-                           
-            # Styling
-            anim_ax.set_xlim(0, self.beam_engine.beam_props.length)
-            anim_ax.set_ylim(-3, 3)
-            anim_ax.set_xlabel('Position (m)', color='white', fontweight='bold')
-            anim_ax.set_ylabel('Deflection (scaled)', color='white', fontweight='bold')
-            anim_ax.set_title(f'🎬 Animated Beam Deflection - Frame {frame}', 
-                             color='white', fontweight='bold', fontsize=14)
-            anim_ax.grid(True, alpha=0.3, color='cyan')
-            anim_ax.tick_params(colors='white')
-            anim_ax.legend(facecolor='black', edgecolor='white')
-            
-            return []
-            
-        # Start animation
-        anim = FuncAnimation(anim_fig, animate_frame, frames=200, interval=50, 
-                           blit=False, repeat=True)
-        anim_canvas.draw()
+            for idx, position, arrow, label in load_artists:
+                arrow_y = wave_deflection[idx] + 0.5
+                arrow.xy = (position, arrow_y-0.3)
+                arrow.set_position((position, arrow_y))
+                label.set_position((position, arrow_y+0.1))
+                
+            frame_label.set_text(f'Frame {frame}')
+            
+            return moving_artists
+            
+        # Start animation; the canvas only holds a weak reference to it, so keep one on
+        # the window or it is collected before the idle draw that starts it
+        anim_window.anim = FuncAnimation(anim_fig, animate_frame, frames=200, interval=50,
+                                         blit=True, repeat=True)
+        anim_canvas.draw_idle()
         
         # Stop animation when window is closed
         def on_closing():
@@ -1488,6 +1418,15 @@ RECOMMENDATIONS:
                               command=perform_export, bootstyle="success")
         export_btn.pack(pady=20)
         
+    def model_data(self):
+        """Beam, supports and loads as plain dicts, shared by the JSON export and project files"""
+        return {
+            "beam_properties": asdict(self.beam_engine.beam_props),
+            "supports": list(map(asdict, self.beam_engine.supports)),
+            "concentrated_loads": list(map(asdict, self.beam_engine.concentrated_loads)),
+            "varying_loads": list(map(asdict, self.beam_engine.varying_loads))
+        }
+        
     def export_json(self):
         """Export results to JSON format"""
         filename = filedialog.asksaveasfilename(
@@ -1496,31 +1435,25 @@ RECOMMENDATIONS:
         )
         
         if filename:
+            model = self.model_data()
             export_data = {
-                "beam_properties": {
-                    "length": self.beam_engine.beam_props.length,
-                    "elastic_modulus": self.beam_engine.beam_props.elastic_modulus,
-                    "moment_of_inertia": self.beam_engine.beam_props.moment_of_inertia,
-                    "cross_section_area": self.beam_engine.beam_props.cross_section_area
-                },
-                "supports": [{"position": s.position, "type": s.type} for s in self.beam_engine.supports],
+                "beam_properties": model["beam_properties"],
+                "supports": model["supports"],
                 "loads": {
-                    "concentrated": [{"position": l.position, "magnitude": l.magnitude, "angle": l.angle} 
-                                   for l in self.beam_engine.concentrated_loads],
-                    "varying": [{"start_pos": l.start_pos, "end_pos": l.end_pos,
-                               "start_magnitude": l.start_magnitude, "end_magnitude": l.end_magnitude}
-                              for l in self.beam_engine.varying_loads]
+                    "concentrated": model["concentrated_loads"],
+                    "varying": model["varying_loads"]
                 },
                 "results": {
-                    "max_moment": float(self.beam_engine.results["max_moment"]),
-                    "max_deflection": float(self.beam_engine.results["max_deflection"]),
-                    "max_stress": float(self.beam_engine.results["max_stress"]),
-                    "reactions": [float(r) for r in self.beam_engine.results["reactions"]]
+                    "max_moment": self.beam_engine.results["max_moment"],
+                    "max_deflection": self.beam_engine.results["max_deflection"],
+                    "max_stress": self.beam_engine.results["max_stress"],
+                    "reactions": self.beam_engine.results["reactions"]
                 }
             }
             
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # orjson takes NumPy scalars and arrays as they are
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
                 
     def export_csv(self):
         """Export numerical results to CSV"""
@@ -1531,21 +1464,12 @@ RECOMMENDATIONS:
         
         if filename:
             results = self.beam_engine.results
-            import csv
+            table = np.column_stack([results[key] for key in ('x', 'shear', 'moment', 'deflection', 'stress')])
             
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Position (m)", "Shear Force (N)", "Bending Moment (N⋅m)", 
-                               "Deflection (m)", "Stress (Pa)"])
-                
-                for i in range(len(results['x'])):
-                    writer.writerow([
-                        results['x'][i],
-                        results['shear'][i],
-                        results['moment'][i],
-                        results['deflection'][i],
-                        results['stress'][i]
-                    ])
+            # One vectorized write; %.9g round-trips the float32 results exactly
+            np.savetxt(filename, table, fmt='%.9g', delimiter=',', newline='\r\n',
+                       header="Position (m),Shear Force (N),Bending Moment (N⋅m),Deflection (m),Stress (Pa)",
+                       comments='', encoding='utf-8')
                     
     def export_pdf(self):
         """Export comprehensive PDF report"""
@@ -1584,8 +1508,9 @@ RECOMMENDATIONS:
             # Clear plots
             for ax in [self.ax_3d, self.ax_shear, self.ax_moment]:
                 ax.clear()
+            self.diagram_artists = None
                 
-            self.canvas.draw()
+            self.canvas.draw_idle()
             self.update_status("🧹 All data cleared - Ready for new analysis!")
             
     def update_status(self, message):
@@ -1605,25 +1530,20 @@ RECOMMENDATIONS:
         )
         
         if filename:
-            project_data = {
-                "beam_properties": {
-                    "length": self.beam_engine.beam_props.length,
-                    "elastic_modulus": self.beam_engine.beam_props.elastic_modulus,
-                    "moment_of_inertia": self.beam_engine.beam_props.moment_of_inertia,
-                    "cross_section_area": self.beam_engine.beam_props.cross_section_area
-                },
-                "supports": [{"position": s.position, "type": s.type} for s in self.beam_engine.supports],
-                "concentrated_loads": [{"position": l.position, "magnitude": l.magnitude, "angle": l.angle} 
-                                     for l in self.beam_engine.concentrated_loads],
-                "varying_loads": [{"start_pos": l.start_pos, "end_pos": l.end_pos,
-                                 "start_magnitude": l.start_magnitude, "end_magnitude": l.end_magnitude}
-                                for l in self.beam_engine.varying_loads]
-            }
-            
-            with open(filename, 'w') as f:
-                json.dump(project_data, f, indent=2)
-                
-            messagebox.showinfo("Success", "Project saved successfully!")
+            project_data = self.model_data()
+            
+            # Encode and write off the Tk thread; only the dialogs come back to it
+            def write_project():
+                try:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(project_data, option=orjson.OPT_INDENT_2))
+                except OSError as e:
+                    self.after(0, lambda error=e: messagebox.showerror(
+                        "Save Error", f"Failed to save project: {error}"))
+                else:
+                    self.after(0, lambda: messagebox.showinfo("Success", "Project saved successfully!"))
+                    
+            threading.Thread(target=write_project, daemon=True).start()
             
     def load_project(self):
         """Load project from file"""
@@ -1632,56 +1552,69 @@ RECOMMENDATIONS:
         )
         
         if filename:
-            try:
-                with open(filename, 'r') as f:
-                    project_data = json.load(f)
+            # Read and parse off the Tk thread, then rebuild the beam on it
+            def read_project():
+                try:
+                    with open(filename, 'rb') as f:
+                        project_data = orjson.loads(f.read())
+                except Exception as e:
+                    self.after(0, lambda error=e: messagebox.showerror(
+                        "Load Error", f"Failed to load project: {error}"))
+                else:
+                    self.after(0, lambda: self.apply_project(project_data))
                     
-                # Create beam
-                beam_props = BeamProperties(**project_data["beam_properties"])
-                self.beam_engine = AdvancedBeamEngine(beam_props)
+            threading.Thread(target=read_project, daemon=True).start()
+            
+    def apply_project(self, project_data):
+        """Rebuild the beam from parsed project data"""
+        try:
+            # Create beam
+            beam_props = BeamProperties(**project_data["beam_properties"])
+            self.beam_engine = AdvancedBeamEngine(beam_props)
+            
+            # Load supports
+            for support_data in project_data["supports"]:
+                support = Support(**support_data)
+                self.beam_engine.add_support(support)
                 
-                # Load supports
-                for support_data in project_data["supports"]:
-                    support = Support(**support_data)
-                    self.beam_engine.add_support(support)
-                    
-                # Load loads
-                for load_data in project_data["concentrated_loads"]:
-                    load = ConcentratedLoad(**load_data)
-                    self.beam_engine.add_concentrated_load(load)
-                    
-                for load_data in project_data["varying_loads"]:
-                    load = UniformlyVaryingLoad(**load_data)
-                    self.beam_engine.add_varying_load(load)
-                    
-                # Update interface
-                self.refresh_interface()
-                messagebox.showinfo("Success", "Project loaded successfully!")
+            # Load loads
+            for load_data in project_data["concentrated_loads"]:
+                load = ConcentratedLoad(**load_data)
+                self.beam_engine.add_concentrated_load(load)
                 
-            except Exception as e:
-                messagebox.showerror("Load Error", f"Failed to load project: {e}")
+            for load_data in project_data["varying_loads"]:
+                load = UniformlyVaryingLoad(**load_data)
+                self.beam_engine.add_varying_load(load)
                 
+            # Update interface
+            self.refresh_interface()
+            messagebox.showinfo("Success", "Project loaded successfully!")
+            
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Failed to load project: {e}")
+            
     def refresh_interface(self):
         """Refresh interface after loading project"""
         # Clear and update listboxes
         self.support_listbox.delete(0, tk.END)
         self.load_listbox.delete(0, tk.END)
         
-        for support in self.beam_engine.supports:
-            self.support_listbox.insert(tk.END, f"{support.type.title()} @ {support.position}m")
+        # One Tk insert call per listbox with all of its rows
+        self.support_listbox.insert(tk.END, *(
+            f"{support.type.title()} @ {support.position}m" for support in self.beam_engine.supports))
             
-        for load in self.beam_engine.concentrated_loads:
-            self.load_listbox.insert(tk.END, f"Conc: {load.magnitude/1000:.1f}kN @ {load.position}m")
-            
-        for load in self.beam_engine.varying_loads:
-            self.load_listbox.insert(tk.END, f"Vary: {load.start_magnitude/1000:.1f}-{load.end_magnitude/1000:.1f}kN/m")
+        self.load_listbox.insert(tk.END, *(
+            [f"Conc: {load.magnitude/1000:.1f}kN @ {load.position}m"
+             for load in self.beam_engine.concentrated_loads] +
+            [f"Vary: {load.start_magnitude/1000:.1f}-{load.end_magnitude/1000:.1f}kN/m"
+             for load in self.beam_engine.varying_loads]))
             
         # Update visualization
         self.update_3d_visualization()
         
         # Auto-analyze if enabled
         if self.auto_analyze.get():
-            self.analyze_beam()
+            self.schedule_analysis()
 
 def main():
     """Main application entry point"""
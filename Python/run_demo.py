@@ -16,18 +16,23 @@ Features:
 
 import sys
 import subprocess
+from importlib import metadata
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, FancyBboxPatch
+from matplotlib.collections import PolyCollection
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
 import time
 import os
 from datetime import datetime
-import json
+import orjson
 
-# Set beautiful matplotlib style
-plt.style.use('dark_background')
+def cumulative_trapezoid(y, x):
+    """Running trapezoid-rule integral of y over x, starting from zero at x[0]"""
+    integral = np.zeros_like(y)
+    np.cumsum((y[1:] + y[:-1]) * np.diff(x) / 2, out=integral[1:])
+    return integral
 
 class BeamAnalysisSystem:
     """Advanced 3D Interactive Beam Analysis System"""
@@ -35,7 +40,7 @@ class BeamAnalysisSystem:
     def __init__(self):
         self.theme = "cyberpunk"
         self.animation_speed = 0.1
-        self.export_quality = 300
+        self.export_quality = 150  # dpi; 300 with --high-quality
         self.results_history = []
         self.performance_metrics = {}
         
@@ -91,16 +96,16 @@ class BeamAnalysisSystem:
         missing_packages = []
         
         for package, version in required_packages.items():
+            # Look up the installed distribution rather than importing it
             try:
-                __import__(package)
+                metadata.version(package)
                 print(f"✅ {package} {version} - INSTALLED")
-            except ImportError:
+            except metadata.PackageNotFoundError:
                 print(f"❌ {package} {version} - MISSING")
                 missing_packages.append(package)
         
         if missing_packages:
             print(f"\n📦 Installing {len(missing_packages)} missing packages...")
-            self._animate_installation_progress()
             
             try:
                 subprocess.check_call([
@@ -114,15 +119,6 @@ class BeamAnalysisSystem:
         print("🎯 System ready for advanced analysis!")
         return True
     
-    def _animate_installation_progress(self):
-        """Animated installation progress"""
-        import time
-        for i in range(20):
-            progress = "█" * (i // 2) + "░" * (10 - i // 2)
-            print(f"\r📥 Installing... [{progress}] {i*5}%", end="", flush=True)
-            time.sleep(0.1)
-        print("\n")
-    
     def create_advanced_beam(self):
         """🏗️ Create an advanced 3D beam with complex loading"""
         print("\n🏗️ CREATING ADVANCED 3D BEAM STRUCTURE")
@@ -162,17 +158,15 @@ class BeamAnalysisSystem:
                 """Advanced finite element analysis simulation"""
                 print("🔬 Running advanced FEA analysis...")
                 
-                # Simulate analysis time
-                time.sleep(1)
-                
                 # Generate realistic analysis results
+                self._finalize()
                 x = np.linspace(0, self.length, 1000)
                 
                 # Simulated shear force and bending moment
                 shear = self._calculate_shear_force(x)
                 moment = self._calculate_bending_moment(x)
-                deflection = self._calculate_deflection(x)
-                stress = self._calculate_stress(x)
+                deflection = self._calculate_deflection(x, moment)
+                stress = self._calculate_stress(moment)
                 
                 self.analysis_results = {
                     'x': x,
@@ -188,46 +182,49 @@ class BeamAnalysisSystem:
                 
                 return self.analysis_results
             
+            def _finalize(self):
+                """Pack the load and support dicts into arrays for the analysis kernels"""
+                n_loads = len(self.loads)
+                self.load_pos = np.fromiter((load['pos'] for load in self.loads), float, n_loads)
+                self.load_mag = np.fromiter((load['mag'] for load in self.loads), float, n_loads)
+                self.point_load = np.fromiter((load['type'] == 'point' for load in self.loads), bool, n_loads)
+                self.support_pos = np.fromiter((support['pos'] for support in self.supports), float, len(self.supports))
+                self.total_load = self.load_mag.sum()
+            
             def _calculate_shear_force(self, x):
                 """Simulated shear force calculation"""
-                shear = np.zeros_like(x)
-                for load in self.loads:
-                    if load['type'] == 'point':
-                        shear += np.where(x >= load['pos'], -load['mag'], 0)
+                # Each load or support acts on every point at or to its right
+                shear = -((x[:, None] >= self.load_pos[self.point_load]) @ self.load_mag[self.point_load])
                 # Add support reactions (simplified)
-                for support in self.supports:
-                    reaction = sum(load['mag'] for load in self.loads) / len(self.supports)
-                    shear += np.where(x >= support['pos'], reaction, 0)
+                if len(self.support_pos):
+                    reaction = self.total_load / len(self.support_pos)
+                    shear += reaction * (x[:, None] >= self.support_pos).sum(axis=1)
                 return shear
             
             def _calculate_bending_moment(self, x):
                 """Simulated bending moment calculation"""
-                moment = np.zeros_like(x)
-                for i, xi in enumerate(x):
-                    for load in self.loads:
-                        if xi >= load['pos']:
-                            moment[i] += -load['mag'] * (xi - load['pos'])
-                    for support in self.supports:
-                        if xi >= support['pos']:
-                            reaction = sum(load['mag'] for load in self.loads) / len(self.supports)
-                            moment[i] += reaction * (xi - support['pos'])
+                # Lever arm of every point about each load and support, zero to its left
+                moment = -(np.maximum(x[:, None] - self.load_pos, 0) @ self.load_mag)
+                if len(self.support_pos):
+                    reaction = self.total_load / len(self.support_pos)
+                    moment += reaction * np.maximum(x[:, None] - self.support_pos, 0).sum(axis=1)
                 return moment
             
-            def _calculate_deflection(self, x):
-                """Simulated deflection calculation"""
+            def _calculate_deflection(self, x, moment):
+                """Simulated deflection calculation from the bending moment at x"""
                 # Simplified deflection using moment-area method
                 EI = self.material_properties['E'] * self.material_properties['I']
-                moment = self._calculate_bending_moment(x)
-                deflection = np.cumsum(np.cumsum(moment)) * (x[1] - x[0])**2 / EI
+                slope = cumulative_trapezoid(moment, x) / EI
+                deflection = cumulative_trapezoid(slope, x)
                 deflection *= 1000  # Convert to mm
                 return deflection
             
-            def _calculate_stress(self, x):
-                """Calculate bending stress"""
-                moment = self._calculate_bending_moment(x)
+            def _calculate_stress(self, moment):
+                """Calculate bending stress from the bending moment"""
                 y_max = self.height / 2
-                stress = moment * y_max / self.material_properties['I']
-                return stress / 1e6  # Convert to MPa
+                # Section modulus and MPa conversion folded into one scalar,
+                # so the moment array is scaled in a single pass
+                return moment * (y_max / (self.material_properties['I'] * 1e6))
         
         # Create the beam
         beam = AdvancedBeam3D(length=12.0, height=0.6, width=0.3)
@@ -293,41 +290,42 @@ class BeamAnalysisSystem:
         print("=" * 45)
         
         # Set up the figure with dark theme
-        fig = plt.figure(figsize=(20, 16), facecolor='black')
-        fig.suptitle('🏗️ ADVANCED 3D BEAM ANALYSIS SYSTEM', 
-                    fontsize=24, color='white', fontweight='bold', y=0.95)
-        
-        # Create 3D beam visualization
-        ax1 = fig.add_subplot(2, 3, 1, projection='3d')
-        self._plot_3d_beam_structure(ax1, beam)
-        
-        # Shear force diagram with gradient
-        ax2 = fig.add_subplot(2, 3, 2)
-        self._plot_advanced_shear_diagram(ax2, results)
-        
-        # Bending moment diagram with 3D effect
-        ax3 = fig.add_subplot(2, 3, 3)
-        self._plot_advanced_moment_diagram(ax3, results)
-        
-        # Deflection with animation effect
-        ax4 = fig.add_subplot(2, 3, 4)
-        self._plot_deflection_diagram(ax4, results)
-        
-        # Stress distribution heatmap
-        ax5 = fig.add_subplot(2, 3, 5)
-        self._plot_stress_heatmap(ax5, results)
-        
-        # Performance dashboard
-        ax6 = fig.add_subplot(2, 3, 6)
-        self._plot_performance_dashboard(ax6, results)
-        
-        plt.tight_layout()
-        
-        # Save with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f'advanced_beam_analysis_{timestamp}.png'
-        plt.savefig(filename, dpi=self.export_quality, bbox_inches='tight', 
-                   facecolor='black', edgecolor='none')
+        with plt.style.context('dark_background'):
+            fig = plt.figure(figsize=(20, 16), facecolor='black')
+            fig.suptitle('🏗️ ADVANCED 3D BEAM ANALYSIS SYSTEM', 
+                        fontsize=24, color='white', fontweight='bold', y=0.95)
+            
+            # Create 3D beam visualization
+            ax1 = fig.add_subplot(2, 3, 1, projection='3d')
+            self._plot_3d_beam_structure(ax1, beam)
+            
+            # Shear force diagram with gradient
+            ax2 = fig.add_subplot(2, 3, 2)
+            self._plot_advanced_shear_diagram(ax2, results)
+            
+            # Bending moment diagram with 3D effect
+            ax3 = fig.add_subplot(2, 3, 3)
+            self._plot_advanced_moment_diagram(ax3, results)
+            
+            # Deflection with animation effect
+            ax4 = fig.add_subplot(2, 3, 4)
+            self._plot_deflection_diagram(ax4, results)
+            
+            # Stress distribution heatmap
+            ax5 = fig.add_subplot(2, 3, 5)
+            self._plot_stress_heatmap(ax5, results)
+            
+            # Performance dashboard
+            ax6 = fig.add_subplot(2, 3, 6)
+            self._plot_performance_dashboard(ax6, results)
+            
+            plt.tight_layout()
+            
+            # Save with timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f'advanced_beam_analysis_{timestamp}.png'
+            plt.savefig(filename, dpi=self.export_quality, bbox_inches='tight', 
+                       facecolor='black', edgecolor='none')
         
         print(f"📁 High-resolution analysis saved: {filename}")
         
@@ -337,30 +335,33 @@ class BeamAnalysisSystem:
         """Plot 3D beam structure with realistic appearance"""
         ax.set_facecolor('black')
         
-        # Draw beam
-        x = np.linspace(0, beam.length, 100)
-        y = np.zeros_like(x)
-        z = np.zeros_like(x)
-        
-        # Create beam surface
-        Y, Z = np.meshgrid(np.linspace(-beam.width/2, beam.width/2, 10),
-                          np.linspace(0, beam.height, 10))
-        X = np.ones_like(Y)
-        
-        for i in range(len(x)-1):
-            X_surf = X * x[i]
-            ax.plot_surface(X_surf, Y, Z, alpha=0.7, color='lightgray', shade=True)
+        # Draw beam as its four long faces, one surface each
+        u = np.linspace(0, beam.length, 50)
+        X, Y = np.meshgrid(u, np.linspace(-beam.width/2, beam.width/2, 10))
+        _, Z = np.meshgrid(u, np.linspace(0, beam.height, 10))
+
+        for Z_face in (np.zeros_like(X), np.full_like(X, beam.height)):
+            ax.plot_surface(X, Y, Z_face, alpha=0.7, color='lightgray', shade=True)
+        for y_side in (-beam.width/2, beam.width/2):
+            ax.plot_surface(X, np.full_like(X, y_side), Z, alpha=0.7, color='lightgray', shade=True)
         
-        # Add supports with different colors
+        # Add supports with different colors, one scatter per marker shape
         support_colors = {'fixed': 'red', 'pinned': 'blue', 'roller': 'green'}
-        for support in beam.supports:
-            ax.scatter([support['pos']], [0], [0], 
-                      s=200, c=support_colors[support['type']], 
-                      marker='^' if support['type'] == 'pinned' else 's')
-        
-        # Add loads
-        for load in beam.loads:
-            ax.quiver(load['pos'], 0, beam.height, 0, 0, -load['mag']/10,
+        support_pos = np.array([support['pos'] for support in beam.supports], dtype=float)
+        support_type = np.array([support['type'] for support in beam.supports])
+        pinned = support_type == 'pinned'
+        for marker, group in (('^', pinned), ('s', ~pinned)):
+            if group.any():
+                ax.scatter(support_pos[group], np.zeros(group.sum()), np.zeros(group.sum()),
+                          s=200, c=[support_colors[t] for t in support_type[group]],
+                          marker=marker, depthshade=False)
+        
+        # Add loads as a single quiver
+        if beam.loads:
+            load_pos = np.array([load['pos'] for load in beam.loads], dtype=float)
+            load_mag = np.array([load['mag'] for load in beam.loads], dtype=float)
+            zeros = np.zeros_like(load_pos)
+            ax.quiver(load_pos, zeros, np.full_like(load_pos, beam.height), zeros, zeros, -load_mag/10,
                      color='red', arrow_length_ratio=0.1, linewidth=3)
         
         ax.set_title('3D Beam Structure', color='white', fontsize=14, fontweight='bold')
@@ -373,13 +374,17 @@ class BeamAnalysisSystem:
         """Advanced shear force diagram with gradient fill"""
         x, shear = results['x'], results['shear']
         
-        # Create gradient effect
-        colors = ['#ff0080', '#00ff41', '#00ffff']
-        for i in range(len(x)-1):
-            color_intensity = abs(shear[i]) / np.max(np.abs(shear))
-            color_idx = min(int(color_intensity * (len(colors)-1)), len(colors)-1)
-            ax.fill_between(x[i:i+2], 0, shear[i:i+2], 
-                           color=colors[color_idx], alpha=0.8)
+        # Create gradient effect: one filled quad per segment, coloured by
+        # the shear at its left end, all in a single collection
+        colors = np.array(['#ff0080', '#00ff41', '#00ffff'])
+        color_intensity = np.abs(shear[:-1]) / np.max(np.abs(shear))
+        color_idx = np.minimum((color_intensity * (len(colors)-1)).astype(int), len(colors)-1)
+        quads = np.stack([np.column_stack([x[:-1], np.zeros(len(x)-1)]),
+                          np.column_stack([x[:-1], shear[:-1]]),
+                          np.column_stack([x[1:], shear[1:]]),
+                          np.column_stack([x[1:], np.zeros(len(x)-1)])], axis=1)
+        ax.add_collection(PolyCollection(quads, facecolors=colors[color_idx],
+                                         edgecolors=colors[color_idx], alpha=0.8))
         
         ax.plot(x, shear, color='white', linewidth=3, alpha=0.9)
         ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
@@ -435,7 +440,7 @@ class BeamAnalysisSystem:
         
         # Create 2D stress field
         X, Y = np.meshgrid(x[::10], np.linspace(-0.3, 0.3, 20))
-        Z = np.outer(np.ones(20), stress[::10])
+        Z = np.broadcast_to(stress[::10], X.shape)  # same stress at every height, as a view
         
         im = ax.contourf(X, Y, Z, levels=50, cmap='plasma', alpha=0.9)
         ax.contour(X, Y, Z, levels=10, colors='white', alpha=0.5, linewidths=0.5)
@@ -517,8 +522,9 @@ class BeamAnalysisSystem:
         
         # Save report
         report_filename = f"beam_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_filename, 'w') as f:
-            json.dump(report, f, indent=4)
+        # orjson takes the NumPy scalars in results as they are
+        with open(report_filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
         
         print(f"📁 Detailed report saved: {report_filename}")
         
@@ -602,6 +608,8 @@ class BeamAnalysisSystem:
 def main():
     """🎯 Main execution function"""
     system = BeamAnalysisSystem()
+    if '--high-quality' in sys.argv[1:]:
+        system.export_quality = 300
     
     print("🎨 Select visualization theme:")
     print("1. 🌈 Cyberpunk (Default)")
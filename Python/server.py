@@ -1,7 +1,7 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
-from main_gui import AdvancedBeamEngine, BeamProperties, Support, ConcentratedLoad, UniformlyVaryingLoad
-import numpy as np
+from beam_engine import AdvancedBeamEngine, BeamProperties
+import orjson
 
 app = Flask(__name__)
 CORS(app)  # Allow cross-origin requests from the web frontend
@@ -18,34 +18,22 @@ def analyze():
     )
     engine = AdvancedBeamEngine(beam_props)
 
-    # Add supports
-    for s in data['supports']:
-        engine.add_support(Support(position=s['position'], type=s['type']))
-
-    # Add loads
-    for l in data['loads']:
-        if l['type'] == 'concentrated':
-            engine.add_concentrated_load(ConcentratedLoad(
-                position=l['position'],
-                magnitude=l['magnitude']
-            ))
-        elif l['type'] == 'distributed' or l['type'] == 'varying':
-            engine.add_varying_load(UniformlyVaryingLoad(
-                start_pos=l['startPos'],
-                end_pos=l['endPos'],
-                start_magnitude=l['startIntensity'],
-                end_magnitude=l['endIntensity']
-            ))
+    # Set supports
+    engine.set_supports((s['position'], s['type']) for s in data['supports'])
+
+    # Set loads
+    engine.set_loads(
+        concentrated=((l['position'], l['magnitude'])
+                      for l in data['loads'] if l['type'] == 'concentrated'),
+        varying=((l['startPos'], l['endPos'], l['startIntensity'], l['endIntensity'])
+                 for l in data['loads'] if l['type'] == 'distributed' or l['type'] == 'varying'))
 
     # Perform analysis
     results = engine.analyze()
 
-    # Convert numpy arrays to lists for JSON serialization
-    for key, value in results.items():
-        if isinstance(value, np.ndarray):
-            results[key] = value.tolist()
-
-    return jsonify(results)
+    # Serialize the numpy arrays directly instead of converting them to lists
+    return Response(orjson.dumps(results, option=orjson.OPT_SERIALIZE_NUMPY),
+                    mimetype='application/json')
 
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
@@ -0,0 +1,11 @@
+"""
+Gunicorn settings for the beam analyzer API.
+Each analysis is CPU-bound Python, so requests scale with worker processes rather than threads.
+"""
+
+import os
+
+bind = "0.0.0.0:5000"
+workers = os.cpu_count() or 1
+worker_class = "sync"
+timeout = 60